@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+"""
+Chart specs and chart rendering for the PG Seminar Presentation Generator
+A ChartSpec describes a chart completely (type, data, styling, size, DPI)
+and renders either as a native, editable PowerPoint chart (add_native_chart,
+which never imports matplotlib) or as a PNG/SVG image. Types PowerPoint
+cannot express, such as heatmaps, are raster only.
+
+A spec's hash identifies the rendered image. render_chart() looks the hash up
+in a bounded on-disk cache and only draws with matplotlib on a miss;
+unchanged charts cost a hash and a file read instead of an Agg render.
+Charts are drawn on their own Figure and Agg canvas rather than through
+pyplot's global state, so render_charts() can draw the misses of a whole
+asset pack concurrently in a process pool.
+
+Cache settings: SEMINAR_CHART_CACHE_DIR (default: charts/ under
+SEMINAR_CACHE_DIR) and SEMINAR_CHART_CACHE_MAX_BYTES (0 disables caching)
+"""
+
+import hashlib
+import io
+import json
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from importlib import metadata
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from pptx_streaming import atomic_write
+
+# Chart types are XL_CHART_TYPE names in lower case, as in deck specs. Any of them renders
+# natively; these are also drawn as images, plus the raster-only types
+RASTER_TYPES = ("column_clustered", "bar_clustered", "line", "line_markers", "pie", "heatmap")
+RASTER_ONLY_TYPES = ("heatmap",)
+FORMATS = ("png", "svg")
+DEFAULT_SIZE = (6.4, 4.8)
+DEFAULT_DPI = 100
+GROUP_WIDTH = 0.7
+
+DEFAULT_CACHE_DIR = os.path.join(os.environ.get("SEMINAR_CACHE_DIR")
+                                 or os.path.join(os.path.expanduser("~"), ".cache", "seminar-generator"), "charts")
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+# Bump whenever draw code changes what an unchanged spec looks like
+CHART_RENDER_VERSION = 1
+
+# Named colors accepted in specs (matplotlib's values for them); anything else is given as #rrggbb
+NAMED_COLORS = {
+    "black": "000000", "white": "FFFFFF", "gray": "808080", "grey": "808080", "lightgray": "D3D3D3",
+    "red": "FF0000", "darkred": "8B0000", "lightcoral": "F08080", "salmon": "FA8072", "crimson": "DC143C",
+    "orange": "FFA500", "darkorange": "FF8C00", "gold": "FFD700", "yellow": "FFFF00", "brown": "A52A2A",
+    "green": "008000", "darkgreen": "006400", "lime": "00FF00", "yellowgreen": "9ACD32", "teal": "008080",
+    "blue": "0000FF", "navy": "000080", "skyblue": "87CEEB", "lightskyblue": "87CEFA", "steelblue": "4682B4",
+    "purple": "800080", "violet": "EE82EE", "pink": "FFC0CB", "magenta": "FF00FF", "cyan": "00FFFF",
+}
+
+
+@dataclass(frozen=True)
+class ChartSpec:
+    type: str
+    categories: Tuple[str, ...]
+    series: Tuple[Tuple[str, Tuple[float, ...]], ...]
+    title: Optional[str] = None
+    # Category and value axis titles (the category axis is vertical on bar_clustered charts)
+    x_label: Optional[str] = None
+    y_label: Optional[str] = None
+    # One color per category for a single series or a pie, otherwise one per series;
+    # a heatmap takes a single matplotlib colormap name
+    colors: Tuple[str, ...] = ()
+    # Value axis range
+    y_limits: Optional[Tuple[float, float]] = None
+    # Values on bars, percentages on pie slices
+    data_labels: bool = False
+    legend: bool = False
+    start_angle: Optional[float] = None
+    size: Tuple[float, float] = DEFAULT_SIZE
+    dpi: int = DEFAULT_DPI
+    # Crop to the drawn content, like savefig(bbox_inches="tight")
+    tight: bool = False
+
+
+@lru_cache(maxsize=1)
+def _matplotlib_version() -> str:
+    # Read from the package metadata, so a cache hit never imports matplotlib
+    return metadata.version("matplotlib")
+
+
+def is_native(chart_type: str) -> bool:
+    """True when PowerPoint can show the chart type as a native chart"""
+    from pptx.enum.chart import XL_CHART_TYPE
+
+    return chart_type not in RASTER_ONLY_TYPES and hasattr(XL_CHART_TYPE, chart_type.upper())
+
+
+def color_hex(color: str) -> str:
+    """RRGGBB of a named or #rrggbb color; raises ValueError for anything else"""
+    if color.startswith("#") and len(color) == 7:
+        int(color[1:], 16)
+        return color[1:].upper()
+    if color.lower() in NAMED_COLORS:
+        return NAMED_COLORS[color.lower()]
+    raise ValueError(f"unknown color {color!r}; use one of {', '.join(NAMED_COLORS)} or #rrggbb")
+
+
+def chart_key(spec: ChartSpec, format: str = "png") -> str:
+    """Cache key of a rendered chart: the spec, the output format and the renderer versions"""
+    payload = json.dumps([CHART_RENDER_VERSION, _matplotlib_version(), asdict(spec), format],
+                         sort_keys=True)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+class ChartCache:
+    """Rendered charts as files named by chart_key(), evicting the least recently used past a byte budget"""
+
+    def __init__(self, directory: Optional[str] = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = directory or DEFAULT_CACHE_DIR
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "ChartCache":
+        """Build a cache from SEMINAR_CHART_CACHE_DIR and SEMINAR_CHART_CACHE_MAX_BYTES"""
+        return cls(
+            directory=os.environ.get("SEMINAR_CHART_CACHE_DIR") or None,
+            max_bytes=int(os.environ.get("SEMINAR_CHART_CACHE_MAX_BYTES", DEFAULT_MAX_BYTES))
+        )
+
+    def _path(self, key: str, format: str) -> str:
+        return os.path.join(self.directory, f"{key}.{format}")
+
+    def get(self, key: str, format: str) -> Optional[bytes]:
+        if self.max_bytes <= 0:
+            return None
+        path = self._path(key, format)
+        try:
+            with open(path, "rb") as f:
+                blob = f.read()
+            # The modification time doubles as the last use, for eviction
+            os.utime(path)
+        except OSError:
+            return None
+        return blob
+
+    def put(self, key: str, format: str, blob: bytes) -> None:
+        if self.max_bytes <= 0 or len(blob) > self.max_bytes:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        atomic_write(self._path(key, format), lambda f: f.write(blob))
+        with self._lock:
+            self._evict()
+
+    def _evict(self) -> None:
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and not entry.name.endswith(".tmp"):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+
+
+def _draw(spec: ChartSpec, ax) -> None:
+    if spec.type not in RASTER_TYPES:
+        raise ValueError(f"chart type {spec.type!r} can only be rendered natively")
+    names = [name for name, _ in spec.series]
+    horizontal = spec.type == "bar_clustered"
+    if spec.type == "heatmap":
+        # Rows are series, columns are categories
+        image = ax.imshow([values for _, values in spec.series], aspect="auto",
+                          cmap=spec.colors[0] if spec.colors else "viridis")
+        ax.set_xticks(range(len(spec.categories)), spec.categories)
+        ax.set_yticks(range(len(names)), names)
+        if spec.data_labels:
+            for row, (_, values) in enumerate(spec.series):
+                for column, value in enumerate(values):
+                    dark = image.norm(value) < 0.5
+                    ax.text(column, row, f"{value:g}", ha="center", va="center", color="white" if dark else "black")
+        ax.figure.colorbar(image, ax=ax)
+        names = []
+    elif spec.type == "pie":
+        _, values = spec.series[0]
+        ax.pie(values, labels=spec.categories, colors=spec.colors or None,
+               autopct="%1.1f%%" if spec.data_labels else None,
+               startangle=spec.start_angle if spec.start_angle is not None else 0)
+    elif spec.type in ("line", "line_markers"):
+        for i, (name, values) in enumerate(spec.series):
+            color = spec.colors[i] if i < len(spec.colors) else None
+            ax.plot(spec.categories, values, marker="o" if spec.type == "line_markers" else None,
+                    color=color, label=name)
+    else:
+        positions = range(len(spec.categories))
+        width = GROUP_WIDTH / len(spec.series) if len(spec.series) > 1 else 0.8
+        for i, (name, values) in enumerate(spec.series):
+            if len(spec.series) == 1:
+                color = list(spec.colors) or None
+                offsets = list(positions)
+            else:
+                color = spec.colors[i] if i < len(spec.colors) else None
+                shift = (i - (len(spec.series) - 1) / 2) * width
+                offsets = [p + shift for p in positions]
+            draw = ax.barh if horizontal else ax.bar
+            bars = draw(offsets, values, width, label=name, color=color)
+            if spec.data_labels:
+                ax.bar_label(bars)
+        if horizontal:
+            ax.set_yticks(list(positions), spec.categories)
+        else:
+            ax.set_xticks(list(positions), spec.categories)
+
+    if spec.title:
+        ax.set_title(spec.title)
+    if spec.x_label:
+        (ax.set_ylabel if horizontal else ax.set_xlabel)(spec.x_label)
+    if spec.y_label:
+        (ax.set_xlabel if horizontal else ax.set_ylabel)(spec.y_label)
+    if spec.y_limits:
+        (ax.set_xlim if horizontal else ax.set_ylim)(*spec.y_limits)
+    if spec.legend and names:
+        ax.legend()
+
+
+def add_native_chart(shapes, spec: ChartSpec, left: float, top: float):
+    """Add the chart to a slide's shapes as an editable PowerPoint chart at (left, top) inches"""
+    from pptx.chart.data import CategoryChartData
+    from pptx.dml.color import RGBColor
+    from pptx.enum.chart import XL_CHART_TYPE
+    from pptx.util import Inches
+
+    if not is_native(spec.type):
+        raise ValueError(f"chart type {spec.type!r} has no native PowerPoint equivalent")
+    chart_data = CategoryChartData()
+    chart_data.categories = spec.categories
+    for name, values in spec.series:
+        chart_data.add_series(name, values)
+    width, height = spec.size
+    chart = shapes.add_chart(
+        getattr(XL_CHART_TYPE, spec.type.upper()),
+        Inches(left), Inches(top), Inches(width), Inches(height),
+        chart_data
+    ).chart
+    if spec.title:
+        chart.has_title = True
+        chart.chart_title.text_frame.text = spec.title
+    if spec.legend:
+        chart.has_legend = True
+        chart.legend.include_in_layout = False
+
+    plot = chart.plots[0]
+    if spec.colors:
+        # One color per point for a single series or a pie, otherwise one per series
+        by_point = len(spec.series) == 1
+        targets = plot.series[0].points if by_point else plot.series
+        for i, color in enumerate(spec.colors[:len(spec.categories) if by_point else len(spec.series)]):
+            fill = targets[i].format.fill
+            fill.solid()
+            fill.fore_color.rgb = RGBColor.from_string(color_hex(color))
+    if spec.data_labels:
+        plot.has_data_labels = True
+        if spec.type.startswith("pie"):
+            plot.data_labels.show_value = False
+            plot.data_labels.show_percentage = True
+            plot.data_labels.number_format = "0.0%"
+            plot.data_labels.number_format_is_linked = False
+
+    if not spec.type.startswith(("pie", "doughnut")):
+        for axis, label in ((chart.category_axis, spec.x_label), (chart.value_axis, spec.y_label)):
+            if label:
+                axis.axis_title.text_frame.text = label
+        if spec.y_limits:
+            chart.value_axis.minimum_scale, chart.value_axis.maximum_scale = spec.y_limits
+    return chart
+
+
+def draw_chart(spec: ChartSpec, format: str = "png") -> bytes:
+    """Render a chart with matplotlib, bypassing the cache; no global pyplot state is touched"""
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    # A standalone figure is garbage collected with its canvas; there is no pyplot state to close
+    fig = Figure(figsize=spec.size)
+    FigureCanvasAgg(fig)
+    _draw(spec, fig.add_subplot())
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format=format, dpi=spec.dpi, bbox_inches="tight" if spec.tight else None)
+    return buffer.getvalue()
+
+
+def render_chart(spec: ChartSpec, format: str = "png", cache: Optional[ChartCache] = None) -> bytes:
+    """Rendered chart bytes, drawn only when the spec is not in the cache"""
+    if format not in FORMATS:
+        raise ValueError(f"format must be one of {', '.join(FORMATS)}")
+    cache = cache or default_cache
+    key = chart_key(spec, format)
+    blob = cache.get(key, format)
+    if blob is None:
+        blob = draw_chart(spec, format)
+        cache.put(key, format, blob)
+    return blob
+
+
+def render_charts(specs: Sequence[ChartSpec], format: str = "png", cache: Optional[ChartCache] = None,
+                  executor: Optional[Executor] = None) -> List[bytes]:
+    """Rendered bytes of many charts: cache hits are read, misses are drawn concurrently
+
+    Misses are drawn on `executor` (e.g. a server's render pool), or on a process pool
+    with one worker per missing chart up to the CPU count, so a batch takes about as long
+    as its slowest chart. A single miss without an executor is drawn in-process.
+    """
+    if format not in FORMATS:
+        raise ValueError(f"format must be one of {', '.join(FORMATS)}")
+    cache = cache or default_cache
+    keys = [chart_key(spec, format) for spec in specs]
+    blobs: Dict[str, Optional[bytes]] = {key: cache.get(key, format) for key in keys}
+    misses = {key: spec for key, spec in zip(keys, specs) if blobs[key] is None}
+
+    if len(misses) == 1 and executor is None:
+        (key, spec), = misses.items()
+        blobs[key] = draw_chart(spec, format)
+        cache.put(key, format, blobs[key])
+    elif misses:
+        pool = executor or ProcessPoolExecutor(max_workers=min(len(misses), os.cpu_count() or 1))
+        try:
+            futures = {key: pool.submit(draw_chart, spec, format) for key, spec in misses.items()}
+            for key, future in futures.items():
+                blobs[key] = future.result()
+                cache.put(key, format, blobs[key])
+        finally:
+            if executor is None:
+                pool.shutdown()
+    return [blobs[key] for key in keys]
+
+
+def _format(path: str) -> str:
+    return os.path.splitext(path)[1].lstrip(".").lower() or "png"
+
+
+def save_chart(spec: ChartSpec, path: str, cache: Optional[ChartCache] = None) -> str:
+    """Render a chart into `path`, in the format named by its extension"""
+    blob = render_chart(spec, _format(path), cache)
+    atomic_write(path, lambda f: f.write(blob))
+    return path
+
+
+def save_charts(charts: Dict[str, ChartSpec], cache: Optional[ChartCache] = None,
+                executor: Optional[Executor] = None) -> List[str]:
+    """Render a {path: spec} asset pack concurrently, each in the format named by its extension"""
+    by_format: Dict[str, List[str]] = {}
+    for path in charts:
+        by_format.setdefault(_format(path), []).append(path)
+    for format, paths in by_format.items():
+        for path, blob in zip(paths, render_charts([charts[path] for path in paths], format, cache, executor)):
+            atomic_write(path, lambda f: f.write(blob))
+    return list(charts)
+
+
+# Shared by every caller in the process
+default_cache = ChartCache.from_env()
@@ -0,0 +1,643 @@
+#!/usr/bin/env python3
+"""
+Declarative deck engine for the PG Seminar Presentation Generator
+Renders deck specs (JSON, or YAML when PyYAML is installed) with python-pptx.
+Specs are parsed and validated once per file, and a single DeckRenderer can
+render many decks in one process. --streaming writes each slide into the
+output zip as soon as it is filled, keeping memory flat for large decks.
+--incremental hashes every slide and copies unchanged slides from the
+previous output instead of re-rendering them. Bullet lists that would
+overflow their placeholder are split onto continuation slides or shrunk,
+per the spec's "overflow" setting; --check lists them. Images are loaded
+through a content-addressed media store shared by every deck in the process
+and re-encoded for their display size at --image-dpi.
+
+Usage: python deck_engine.py decks/lancet.json [decks/basic.json ...] [--output-dir DIR] [--check]
+       [--streaming | --incremental] [--image-dpi DPI]
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import os
+import sys
+import zipfile
+from dataclasses import asdict, dataclass, field, replace
+from typing import IO, Any, Dict, List, Optional, Sequence, Tuple
+
+import pptx
+from pptx.util import Inches
+
+from charts import RASTER_ONLY_TYPES, RASTER_TYPES, ChartSpec, add_native_chart, color_hex, is_native, render_chart
+from image_optimizer import DEFAULT_DPI
+from media_store import MediaStore, default_store
+from pptx_streaming import StreamingPackageWriter, atomic_write
+from template_pool import TemplatePool, default_pool
+from text_fit import BodyMetrics, apply_font_scale, body_metrics, fits, paginate, shrink_scale
+from text_frames import fill_text_frame
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+DECKS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "decks")
+
+# Spec layout name -> (layout name in the template, index in the default template)
+LAYOUTS = {
+    "title": ("Title Slide", 0),
+    "title_and_content": ("Title and Content", 1),
+    "section_header": ("Section Header", 2),
+    "two_content": ("Two Content", 3),
+    "comparison": ("Comparison", 4),
+    "title_only": ("Title Only", 5),
+    "blank": ("Blank", 6),
+}
+BODY_LAYOUTS = {"title_and_content", "section_header", "two_content", "comparison"}
+DEFAULT_CHART_POSITION = (1.0, 1.0, 8.0, 5.0)
+# Charts are native PowerPoint charts unless the type has no native form, or a spec asks for an image
+CHART_FORMATS = ("native", "png")
+# [left, top, width]: the height follows the image's aspect ratio
+DEFAULT_IMAGE_POSITION = (1.0, 1.5, 8.0)
+MAX_BULLET_LEVEL = 8
+# How a bullet list too tall for its placeholder is handled: split onto "(cont.)" slides,
+# shrink the font, or leave it as written
+OVERFLOW_MODES = ("paginate", "shrink", "none")
+CONTINUED_SUFFIX = " (cont.)"
+
+# Bump whenever the renderer's output for an unchanged spec changes, so incremental
+# rebuilds stop reusing slides rendered by the old code
+RENDER_VERSION = 5
+MANIFEST_SUFFIX = ".manifest.json"
+
+
+class DeckSpecError(ValueError):
+    """Raised when a deck spec is malformed; the message names the offending field"""
+
+
+@dataclass(frozen=True)
+class Bullet:
+    text: str
+    level: int = 0
+
+
+@dataclass(frozen=True)
+class ImageSpec:
+    path: str
+    position: Tuple[float, ...] = DEFAULT_IMAGE_POSITION
+
+
+@dataclass(frozen=True)
+class SlideSpec:
+    layout: str
+    title: Optional[str] = None
+    subtitle: Optional[str] = None
+    bullets: Tuple[Bullet, ...] = ()
+    # The chart's size is part of its ChartSpec; the slide places it
+    chart: Optional[ChartSpec] = None
+    chart_origin: Tuple[float, float] = DEFAULT_CHART_POSITION[:2]
+    chart_format: str = "native"
+    image: Optional[ImageSpec] = None
+    notes: Optional[str] = None
+    # None follows the deck's setting
+    overflow: Optional[str] = None
+    # Set by DeckRenderer.plan() on slides it shrinks; percent of the template's font sizes
+    font_scale: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class DeckSpec:
+    name: str
+    output: str
+    slides: Tuple[SlideSpec, ...] = field(default_factory=tuple)
+    template: Optional[str] = None
+    overflow: str = "paginate"
+
+
+def _require(condition: bool, where: str, message: str) -> None:
+    if not condition:
+        raise DeckSpecError(f"{where}: {message}")
+
+
+def _optional_str(data: Dict[str, Any], key: str, where: str) -> Optional[str]:
+    value = data.get(key)
+    _require(value is None or isinstance(value, str), f"{where}.{key}", "must be a string")
+    return value
+
+
+def _optional_overflow(data: Dict[str, Any], where: str) -> Optional[str]:
+    value = data.get("overflow")
+    _require(value is None or value in OVERFLOW_MODES, f"{where}.overflow",
+             f"must be one of {', '.join(OVERFLOW_MODES)}")
+    return value
+
+
+def _parse_bullet(item: Any, where: str) -> Bullet:
+    if isinstance(item, str):
+        return Bullet(item)
+    _require(isinstance(item, dict) and isinstance(item.get("text"), str), where,
+             "must be a string or an object with a 'text' string")
+    level = item.get("level", 0)
+    _require(isinstance(level, int) and 0 <= level <= MAX_BULLET_LEVEL, f"{where}.level",
+             f"must be an integer between 0 and {MAX_BULLET_LEVEL}")
+    return Bullet(item["text"], level)
+
+
+def _query_chart(data: Any, where: str) -> Tuple[tuple, tuple]:
+    """Resolve a chart's indicator query into its categories and series"""
+    _require(isinstance(data, dict), where, "must be an object")
+    series = data.get("series")
+    _require(isinstance(series, dict) and series and all(isinstance(v, str) for v in series.values()),
+             f"{where}.series", "must map series names to indicators")
+    _require(isinstance(data.get("by"), str), f"{where}.by", "must name the column to draw categories from")
+    categories = data.get("categories")
+    _require(categories is None or (isinstance(categories, list) and categories), f"{where}.categories",
+             "must be a non-empty list")
+    labels = data.get("labels", {})
+    _require(isinstance(labels, dict) and all(isinstance(v, str) for v in labels.values()), f"{where}.labels",
+             "must map categories to display labels")
+    filters = {key: value for key, value in data.items() if key not in ("series", "by", "categories", "labels")}
+
+    # pandas is only imported for decks that query indicators
+    from indicators import default_store
+    try:
+        chart = default_store.chart_data(series, data["by"], categories, labels, **filters)
+    except (OSError, ValueError) as e:
+        raise DeckSpecError(f"{where}: {e}")
+    return chart["categories"], chart["series"]
+
+
+def _parse_chart(data: Any, where: str) -> Tuple[ChartSpec, Tuple[float, float], str]:
+    """Parse a slide's chart into its spec, its (left, top) position and its format"""
+    _require(isinstance(data, dict), where, "must be an object")
+    chart_type = data.get("type")
+    _require(isinstance(chart_type, str) and (chart_type.lower() in RASTER_TYPES or is_native(chart_type.lower())),
+             f"{where}.type", f"unknown chart type {chart_type!r}")
+    chart_type = chart_type.lower()
+    chart_format = data.get("format", "native" if is_native(chart_type) else "png")
+    _require(chart_format in CHART_FORMATS, f"{where}.format", f"must be one of {', '.join(CHART_FORMATS)}")
+    _require(chart_format == "native" or chart_type in RASTER_TYPES, f"{where}.format",
+             f"chart type {chart_type!r} can only be rendered natively")
+    _require(chart_format == "png" or chart_type not in RASTER_ONLY_TYPES, f"{where}.format",
+             f"chart type {chart_type!r} has no native PowerPoint form")
+
+    if "query" in data:
+        categories, parsed_series = _query_chart(data["query"], f"{where}.query")
+    else:
+        categories = data.get("categories")
+        _require(isinstance(categories, list) and categories, f"{where}.categories", "must be a non-empty list")
+
+        series = data.get("series")
+        _require(isinstance(series, list) and series, f"{where}.series", "must be a non-empty list")
+        parsed_series = []
+        for i, item in enumerate(series):
+            item_where = f"{where}.series[{i}]"
+            _require(isinstance(item, dict) and isinstance(item.get("name"), str), item_where,
+                     "must be an object with a 'name' string")
+            values = item.get("values")
+            _require(isinstance(values, list) and len(values) == len(categories), f"{item_where}.values",
+                     f"must list one number per category ({len(categories)})")
+            _require(all(isinstance(v, (int, float)) for v in values), f"{item_where}.values", "must be numbers")
+            parsed_series.append((item["name"], tuple(values)))
+
+    position = data.get("position", list(DEFAULT_CHART_POSITION))
+    _require(isinstance(position, list) and len(position) == 4 and all(isinstance(v, (int, float)) for v in position),
+             f"{where}.position", "must be [left, top, width, height] in inches")
+
+    colors = data.get("colors", [])
+    _require(isinstance(colors, list) and all(isinstance(c, str) for c in colors), f"{where}.colors",
+             "must be a list of color names")
+    if chart_type != "heatmap":
+        for color in colors:
+            try:
+                color_hex(color)
+            except ValueError as e:
+                raise DeckSpecError(f"{where}.colors: {e}")
+    y_limits = data.get("y_limits")
+    _require(y_limits is None or (isinstance(y_limits, list) and len(y_limits) == 2
+                                  and all(isinstance(v, (int, float)) for v in y_limits)),
+             f"{where}.y_limits", "must be [minimum, maximum]")
+    for key in ("data_labels", "legend"):
+        _require(isinstance(data.get(key, False), bool), f"{where}.{key}", "must be true or false")
+    dpi = data.get("dpi", DEFAULT_DPI)
+    _require(isinstance(dpi, int) and dpi > 0, f"{where}.dpi", "must be a positive integer")
+
+    left, top, width, height = (float(v) for v in position)
+    spec = ChartSpec(
+        type=chart_type,
+        categories=tuple(str(c) for c in categories),
+        series=tuple(parsed_series),
+        title=_optional_str(data, "title", where),
+        x_label=_optional_str(data, "x_label", where),
+        y_label=_optional_str(data, "y_label", where),
+        colors=tuple(colors),
+        y_limits=tuple(float(v) for v in y_limits) if y_limits else None,
+        data_labels=data.get("data_labels", False),
+        legend=data.get("legend", False),
+        size=(width, height),
+        # Images are drawn at the resolution other pictures are re-encoded for
+        dpi=dpi
+    )
+    return spec, (left, top), chart_format
+
+
+def _parse_image(data: Any, where: str) -> ImageSpec:
+    if isinstance(data, str):
+        data = {"path": data}
+    _require(isinstance(data, dict) and isinstance(data.get("path"), str), where,
+             "must be a path or an object with a 'path' string")
+    position = data.get("position", list(DEFAULT_IMAGE_POSITION))
+    _require(isinstance(position, list) and len(position) in (3, 4)
+             and all(isinstance(v, (int, float)) for v in position),
+             f"{where}.position", "must be [left, top, width] or [left, top, width, height] in inches")
+    return ImageSpec(path=data["path"], position=tuple(float(v) for v in position))
+
+
+def _parse_slide(data: Any, where: str) -> SlideSpec:
+    _require(isinstance(data, dict), where, "must be an object")
+    layout = data.get("layout", "title_and_content")
+    _require(layout in LAYOUTS, f"{where}.layout", f"must be one of {', '.join(LAYOUTS)}")
+
+    bullets = data.get("bullets", [])
+    _require(isinstance(bullets, list), f"{where}.bullets", "must be a list")
+    _require(not bullets or layout in BODY_LAYOUTS, f"{where}.bullets",
+             f"layout {layout!r} has no body placeholder")
+    subtitle = _optional_str(data, "subtitle", where)
+    _require(subtitle is None or layout == "title", f"{where}.subtitle", "is only valid on the 'title' layout")
+
+    chart, chart_origin, chart_format = None, DEFAULT_CHART_POSITION[:2], "native"
+    if data.get("chart") is not None:
+        chart, chart_origin, chart_format = _parse_chart(data["chart"], f"{where}.chart")
+
+    return SlideSpec(
+        layout=layout,
+        title=_optional_str(data, "title", where),
+        subtitle=subtitle,
+        bullets=tuple(_parse_bullet(item, f"{where}.bullets[{i}]") for i, item in enumerate(bullets)),
+        chart=chart,
+        chart_origin=chart_origin,
+        chart_format=chart_format,
+        image=_parse_image(data["image"], f"{where}.image") if data.get("image") is not None else None,
+        notes=_optional_str(data, "notes", where),
+        overflow=_optional_overflow(data, where)
+    )
+
+
+def parse_deck(data: Any, source: str = "<deck>") -> DeckSpec:
+    """Validate a decoded deck spec and convert it into an immutable DeckSpec"""
+    _require(isinstance(data, dict), source, "deck spec must be an object")
+    name = data.get("name") or os.path.splitext(os.path.basename(source))[0]
+    output = data.get("output") or f"{name}.pptx"
+    _require(isinstance(output, str), f"{source}.output", "must be a string")
+    slides = data.get("slides")
+    _require(isinstance(slides, list) and slides, f"{source}.slides", "must be a non-empty list")
+    return DeckSpec(
+        name=name,
+        output=output,
+        slides=tuple(_parse_slide(slide, f"{source}.slides[{i}]") for i, slide in enumerate(slides)),
+        template=_optional_str(data, "template", source),
+        overflow=_optional_overflow(data, source) or "paginate"
+    )
+
+
+# Path -> (mtime, indicator dataset signature or None, parsed spec)
+_spec_cache: Dict[str, Tuple[float, Optional[tuple], DeckSpec]] = {}
+
+
+def resolve_deck_path(name_or_path: str) -> str:
+    """Accept a spec path, or the bare name of a spec in decks/"""
+    if os.path.exists(name_or_path):
+        return os.path.abspath(name_or_path)
+    for extension in (".json", ".yaml", ".yml"):
+        candidate = os.path.join(DECKS_DIR, name_or_path + extension)
+        if os.path.exists(candidate):
+            return candidate
+    raise FileNotFoundError(f"Deck spec not found: {name_or_path}")
+
+
+def _queries_indicators(data: Any) -> bool:
+    slides = data.get("slides") if isinstance(data, dict) else None
+    return isinstance(slides, list) and any(
+        isinstance(slide, dict) and isinstance(slide.get("chart"), dict) and "query" in slide["chart"]
+        for slide in slides
+    )
+
+
+def _indicator_signature() -> tuple:
+    from indicators import default_store
+    return default_store.signature()
+
+
+def load_deck(name_or_path: str) -> DeckSpec:
+    """Load and validate a deck spec, reusing the parsed spec until the file or the indicator data it queries changes"""
+    path = resolve_deck_path(name_or_path)
+    mtime = os.path.getmtime(path)
+    cached = _spec_cache.get(path)
+    if cached is not None and cached[0] == mtime and (cached[1] is None or cached[1] == _indicator_signature()):
+        return cached[2]
+
+    with open(path, encoding="utf-8") as f:
+        if path.endswith((".yaml", ".yml")):
+            if yaml is None:
+                raise DeckSpecError(f"{path}: PyYAML is required for YAML deck specs")
+            data = yaml.safe_load(f)
+        else:
+            data = json.load(f)
+
+    # Chart queries are resolved while parsing, so their datasets are part of the cache key
+    signature = _indicator_signature() if _queries_indicators(data) else None
+    deck = parse_deck(data, os.path.basename(path))
+    _spec_cache[path] = (mtime, signature, deck)
+    return deck
+
+
+def _template_id(template: Optional[str]) -> str:
+    if template is None:
+        return f"python-pptx {pptx.__version__}"
+    path = os.path.abspath(template)
+    return f"{path}@{os.path.getmtime(path)}"
+
+
+def slide_keys(deck: DeckSpec, media: Optional[MediaStore] = None,
+               image_dpi: Optional[int] = DEFAULT_DPI) -> List[str]:
+    """Content hash of each slide; repeated identical slides get an occurrence suffix
+
+    Images count by content and target DPI, so replacing an image file changes the slide's key.
+    """
+    media = media or default_store
+    seen: Dict[str, int] = {}
+    keys = []
+    for spec in deck.slides:
+        image = [media.load(spec.image.path).digest, image_dpi] if spec.image else None
+        payload = json.dumps([RENDER_VERSION, _template_id(deck.template), asdict(spec), image], sort_keys=True)
+        key = hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+        seen[key] = seen.get(key, 0) + 1
+        keys.append(key if seen[key] == 1 else f"{key}-{seen[key]}")
+    return keys
+
+
+def _load_manifest(path: str, template_id: str) -> Dict[str, Any]:
+    """Slide entries of the previous build of `path`, or {} when there is none to reuse"""
+    try:
+        with open(path + MANIFEST_SUFFIX, encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if manifest.get("version") != RENDER_VERSION or manifest.get("template") != template_id:
+        return {}
+    if not os.path.exists(path):
+        return {}
+    return manifest.get("slides", {})
+
+
+class DeckRenderer:
+    """Render DeckSpecs on pooled template clones, resolving layouts by name once per template"""
+
+    def __init__(self, pool: Optional[TemplatePool] = None, media: Optional[MediaStore] = None,
+                 image_dpi: Optional[int] = DEFAULT_DPI):
+        self.pool = pool or default_pool
+        self.media = media or default_store
+        # None embeds image files unchanged
+        self.image_dpi = image_dpi
+        self._layout_indexes: Dict[Optional[str], Dict[str, int]] = {}
+        self._body_metrics: Dict[Tuple[str, str], Optional[BodyMetrics]] = {}
+
+    def _new_presentation(self, template: Optional[str]):
+        return self.pool.acquire(template)
+
+    def _layout_index(self, prs, template: Optional[str]) -> Dict[str, int]:
+        if template not in self._layout_indexes:
+            by_name = {layout.name: i for i, layout in enumerate(prs.slide_layouts)}
+            self._layout_indexes[template] = {
+                key: by_name.get(layout_name, default_index)
+                for key, (layout_name, default_index) in LAYOUTS.items()
+            }
+        return self._layout_indexes[template]
+
+    def _metrics(self, prs, template: Optional[str], layout: str) -> Optional[BodyMetrics]:
+        # Keyed like the manifests, so an edited template is measured again
+        key = (_template_id(template), layout)
+        if key not in self._body_metrics:
+            index = self._layout_index(prs, template)[layout]
+            self._body_metrics[key] = body_metrics(prs.slide_layouts[index])
+        return self._body_metrics[key]
+
+    def overflowing(self, deck: DeckSpec, prs=None) -> List[int]:
+        """Indexes of the slides whose bullets are estimated not to fit their placeholder"""
+        prs = prs or self._new_presentation(deck.template)
+        result = []
+        for i, spec in enumerate(deck.slides):
+            metrics = self._metrics(prs, deck.template, spec.layout) if spec.bullets else None
+            if metrics is not None and not fits(metrics, spec.bullets):
+                result.append(i)
+        return result
+
+    def plan(self, deck: DeckSpec, prs=None) -> DeckSpec:
+        """Resolve text overflow: the deck as it will be rendered, with continuation slides or font scales"""
+        prs = prs or self._new_presentation(deck.template)
+        overflowing = set(self.overflowing(deck, prs))
+        if not overflowing:
+            return deck
+        slides: List[SlideSpec] = []
+        for i, spec in enumerate(deck.slides):
+            mode = spec.overflow or deck.overflow
+            if i not in overflowing or mode == "none":
+                slides.append(spec)
+                continue
+            metrics = self._metrics(prs, deck.template, spec.layout)
+            if mode == "shrink":
+                slides.append(replace(spec, font_scale=shrink_scale(metrics, spec.bullets)))
+                continue
+            # The chart, image and speaker notes stay with the first page
+            for page, bullets in enumerate(paginate(metrics, spec.bullets)):
+                if page == 0:
+                    slides.append(replace(spec, bullets=tuple(bullets)))
+                    continue
+                title = f"{spec.title}{CONTINUED_SUFFIX}" if spec.title else spec.title
+                slides.append(replace(spec, title=title, bullets=tuple(bullets), chart=None, image=None,
+                                      notes=None))
+        return replace(deck, slides=tuple(slides))
+
+    def render(self, deck: DeckSpec):
+        """Build and return the python-pptx Presentation for a deck"""
+        prs = self._new_presentation(deck.template)
+        layouts = self._layout_index(prs, deck.template)
+        for spec in self.plan(deck, prs).slides:
+            slide = prs.slides.add_slide(prs.slide_layouts[layouts[spec.layout]])
+            self._fill_slide(slide, spec)
+        return prs
+
+    def _fill_slide(self, slide, spec: SlideSpec) -> None:
+        if spec.title is not None:
+            slide.shapes.title.text = spec.title
+        if spec.subtitle is not None:
+            slide.placeholders[1].text = spec.subtitle
+        if spec.bullets:
+            fill_text_frame(slide.placeholders[1].text_frame, spec.bullets)
+            if spec.font_scale is not None:
+                apply_font_scale(slide.placeholders[1].text_frame, spec.font_scale)
+        if spec.chart is not None:
+            self._add_chart(slide, spec)
+        if spec.image is not None:
+            self._add_image(slide, spec.image)
+        if spec.notes:
+            slide.notes_slide.notes_text_frame.text = spec.notes
+
+    def _add_chart(self, slide, spec: SlideSpec) -> None:
+        left, top = spec.chart_origin
+        if spec.chart_format == "native":
+            add_native_chart(slide.shapes, spec.chart, left, top)
+            return
+        # Drawn with matplotlib only here, through the chart render cache
+        width, height = spec.chart.size
+        blob = render_chart(spec.chart, spec.chart_format)
+        slide.shapes.add_picture(io.BytesIO(blob), Inches(left), Inches(top), Inches(width), Inches(height))
+
+    def _add_image(self, slide, spec: ImageSpec) -> None:
+        left, top, width, *height = spec.position
+        if self.image_dpi:
+            item = self.media.optimized(spec.path, width, height[0] if height else None, self.image_dpi)
+        else:
+            item = self.media.load(spec.path)
+        slide.shapes.add_picture(io.BytesIO(item.blob), Inches(left), Inches(top), Inches(width),
+                                 Inches(height[0]) if height else None)
+
+    def stream(self, deck: DeckSpec, output) -> None:
+        """Render a deck into a path or binary file, writing each slide out as soon as it is filled"""
+        prs = self._new_presentation(deck.template)
+        layouts = self._layout_index(prs, deck.template)
+        writer = StreamingPackageWriter(prs, output)
+        try:
+            for spec in self.plan(deck, prs).slides:
+                with writer.slide(prs.slide_layouts[layouts[spec.layout]]) as slide:
+                    self._fill_slide(slide, spec)
+            writer.close()
+        except BaseException:
+            writer.abort()
+            raise
+
+    def rebuild(self, deck: DeckSpec, output: Optional[str] = None) -> Tuple[str, int]:
+        """Re-render only the slides that changed since the last rebuild of `output`
+
+        Unchanged slides, with their charts and notes, are copied from the previous output
+        as listed in its sidecar manifest. Returns (output path, number of slides reused).
+        """
+        path = output or deck.output
+        template_id = _template_id(deck.template)
+        previous = _load_manifest(path, template_id)
+        prs = self._new_presentation(deck.template)
+        layouts = self._layout_index(prs, deck.template)
+        deck = self.plan(deck, prs)
+        entries: Dict[str, Any] = {}
+
+        def write(f) -> None:
+            writer = StreamingPackageWriter(prs, f)
+            try:
+                for key, spec in zip(slide_keys(deck, self.media, self.image_dpi), deck.slides):
+                    if key in previous:
+                        try:
+                            writer.copy_slide(source, previous[key])
+                            entries[key] = previous[key]
+                            continue
+                        except KeyError:
+                            pass
+                    with writer.slide(prs.slide_layouts[layouts[spec.layout]], name=key) as slide:
+                        self._fill_slide(slide, spec)
+                    entries[key] = writer.slides[-1]
+                writer.close()
+            except BaseException:
+                writer.abort()
+                raise
+
+        # The old file is read while the new one is written next to it and swapped in
+        source = zipfile.ZipFile(path) if previous else None
+        try:
+            atomic_write(path, write)
+        finally:
+            if source is not None:
+                source.close()
+
+        with open(path + MANIFEST_SUFFIX, "w", encoding="utf-8") as f:
+            json.dump({"version": RENDER_VERSION, "template": template_id, "slides": entries}, f, indent=1)
+        reused = sum(1 for key, entry in entries.items() if previous.get(key) is entry)
+        return path, reused
+
+    def write(self, deck: DeckSpec, stream: IO[bytes], streaming: bool = False) -> None:
+        """Render a deck into a caller-supplied binary stream"""
+        if streaming:
+            self.stream(deck, stream)
+        else:
+            self.render(deck).save(stream)
+
+    def to_bytes(self, deck: DeckSpec, streaming: bool = False) -> bytes:
+        """Render a deck and return the .pptx as bytes, without touching the filesystem"""
+        buffer = io.BytesIO()
+        self.write(deck, buffer, streaming)
+        return buffer.getvalue()
+
+    def save(self, deck: DeckSpec, output: Optional[str] = None, streaming: bool = False) -> str:
+        """Render a deck and save it, returning the output path"""
+        path = output or deck.output
+        atomic_write(path, lambda f: self.write(deck, f, streaming))
+        return path
+
+
+def render_deck_file(name_or_path: str, output: Optional[str] = None,
+                     renderer: Optional[DeckRenderer] = None, streaming: bool = False) -> str:
+    """Load, validate and render one deck spec"""
+    return (renderer or DeckRenderer()).save(load_deck(name_or_path), output, streaming)
+
+
+def render_deck_bytes(name_or_path: str, renderer: Optional[DeckRenderer] = None,
+                      streaming: bool = False) -> bytes:
+    """Load, validate and render one deck spec to .pptx bytes, e.g. for a download response"""
+    return (renderer or DeckRenderer()).to_bytes(load_deck(name_or_path), streaming)
+
+
+def main(argv: Optional[Sequence[str]] = None):
+    parser = argparse.ArgumentParser(description="Render seminar decks from declarative specs")
+    parser.add_argument("specs", nargs="+", help="Deck spec files or names of specs in decks/")
+    parser.add_argument("--output-dir", default=None, help="Directory for rendered decks (default: current)")
+    parser.add_argument("--check", action="store_true", help="Only validate the specs")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--streaming", action="store_true",
+                      help="Write slides into the zip as they are rendered (low memory for large decks)")
+    mode.add_argument("--incremental", action="store_true",
+                      help="Only re-render slides that changed since the previous --incremental build")
+    parser.add_argument("--image-dpi", type=int, default=DEFAULT_DPI,
+                        help=f"Resolution images are re-encoded for (default: {DEFAULT_DPI}; 0 keeps the files as they are)")
+    args = parser.parse_args(argv)
+
+    decks: List[DeckSpec] = []
+    for spec in args.specs:
+        try:
+            decks.append(load_deck(spec))
+        except (FileNotFoundError, ValueError) as e:
+            print(f"Invalid deck spec: {e}", file=sys.stderr)
+            return 1
+
+    renderer = DeckRenderer(image_dpi=args.image_dpi or None)
+    if args.check:
+        for deck in decks:
+            overflowing = renderer.overflowing(deck)
+            print(f"{deck.name}: {len(deck.slides)} slides OK"
+                  + (f", {len(overflowing)} with overflowing text" if overflowing else ""))
+            for i in overflowing:
+                spec = deck.slides[i]
+                print(f"  slide {i + 1} ({spec.title or spec.layout}): {spec.overflow or deck.overflow}")
+        return 0
+
+    for deck in decks:
+        output = os.path.join(args.output_dir, deck.output) if args.output_dir else deck.output
+        if args.incremental:
+            _, reused = renderer.rebuild(deck, output)
+            print(f"{deck.name}: {len(deck.slides)} slides saved as {output} ({reused} reused)")
+            continue
+        renderer.save(deck, output, streaming=args.streaming)
+        print(f"{deck.name}: {len(deck.slides)} slides saved as {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
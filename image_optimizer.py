@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Image optimization for pictures embedded in seminar decks
+Charts are saved at print resolution (the MCP server uses dpi=300), far more
+pixels than a slide shows. optimize_image() downsamples a picture to its
+display size at a target DPI, stores flat charts as palette PNGs, and keeps
+whichever of PNG and JPEG comes out smaller. MediaStore.optimized() caches
+the result by source hash and display size.
+"""
+
+import io
+from typing import Optional, Tuple
+
+from PIL import Image
+
+DEFAULT_DPI = 150
+JPEG_QUALITY = 85
+PALETTE_COLORS = 256
+# A chart is flat when its most frequent palette colors cover this share of the pixels
+FLAT_COVERAGE = 0.95
+# Bump whenever optimize_image() output changes, so cached variants are rebuilt
+OPTIMIZER_VERSION = 1
+
+
+def display_pixels(blob: bytes, width: float, height: Optional[float], dpi: int) -> Tuple[int, int]:
+    """Pixel box for a picture shown `width` x `height` inches wide at `dpi`; no height keeps the aspect ratio"""
+    with Image.open(io.BytesIO(blob)) as image:
+        source_width, source_height = image.size
+    box_width = max(1, round(width * dpi))
+    if height is None:
+        return box_width, max(1, round(box_width * source_height / source_width))
+    return box_width, max(1, round(height * dpi))
+
+
+def _is_opaque(image: Image.Image) -> bool:
+    if image.mode in ("RGB", "L"):
+        return True
+    if image.mode in ("RGBA", "LA"):
+        return image.getchannel("A").getextrema()[0] == 255
+    return False
+
+
+def _is_flat(image: Image.Image) -> bool:
+    """True for charts and diagrams: a few colors plus antialiasing, as opposed to photographs"""
+    colors = image.getcolors(maxcolors=1 << 16)
+    if colors is None:
+        return False
+    colors.sort(reverse=True)
+    covered = sum(count for count, _ in colors[:PALETTE_COLORS])
+    return covered >= FLAT_COVERAGE * image.width * image.height
+
+
+def _encode(image: Image.Image, format: str, **options) -> bytes:
+    buffer = io.BytesIO()
+    image.save(buffer, format=format, **options)
+    return buffer.getvalue()
+
+
+def optimize_image(blob: bytes, size: Tuple[int, int]) -> Tuple[bytes, str]:
+    """Re-encode an image for display at `size` pixels; returns (bytes, extension)
+
+    Images are only ever scaled down. Flat charts become palette PNGs; photographs
+    may become JPEGs. The source bytes are returned when re-encoding does not help.
+    """
+    with Image.open(io.BytesIO(blob)) as source:
+        source_format = (source.format or "png").lower()
+        image = source.convert("RGBA") if source.mode not in ("RGB", "RGBA", "L", "LA") else source.copy()
+
+    resized = size[0] < image.width or size[1] < image.height
+    if resized:
+        image = image.resize((min(size[0], image.width), min(size[1], image.height)), Image.LANCZOS)
+    opaque = _is_opaque(image)
+    if opaque and image.mode in ("RGBA", "LA"):
+        image = image.convert("RGB" if image.mode == "RGBA" else "L")
+
+    candidates = []
+    if _is_flat(image):
+        # quantize() only takes L, RGB and RGBA images
+        if image.mode == "LA":
+            image = image.convert("RGBA")
+        method = Image.Quantize.FASTOCTREE if image.mode == "RGBA" else Image.Quantize.MEDIANCUT
+        candidates.append((_encode(image.quantize(PALETTE_COLORS, method=method), "PNG", optimize=True), "png"))
+    else:
+        candidates.append((_encode(image, "PNG", optimize=True), "png"))
+        # JPEG artifacts show on chart text and edges, so only photographs are offered as JPEG
+        if opaque:
+            candidates.append((_encode(image, "JPEG", quality=JPEG_QUALITY, optimize=True), "jpg"))
+
+    best = min(candidates, key=lambda candidate: len(candidate[0]))
+    # The original is shown at the same size, so more pixels in fewer bytes still wins
+    if len(best[0]) >= len(blob):
+        return blob, "jpg" if source_format == "jpeg" else source_format
+    return best
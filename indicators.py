@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Health indicator datasets for the PG Seminar Presentation Generator
+Indicators live in versioned CSV or Parquet files (<name>.v<version>.csv)
+under data/indicators, one row per indicator, geography, group and year.
+The newest version of every dataset is read once per process, CSVs through
+a memory map, and indexed on those four columns; a dataset is read again
+only when its file changes. Charts and deck specs query the store instead
+of carrying the numbers themselves.
+"""
+
+import os
+import re
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+INDEX = ("indicator", "geography", "group", "year")
+REQUIRED_COLUMNS = INDEX + ("value",)
+DEFAULT_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "indicators")
+DATASET_FILE = re.compile(r"^(?P<name>.+)\.v(?P<version>\d+)\.(?P<format>csv|parquet)$")
+
+Signature = Tuple[Tuple[str, int, int], ...]
+
+
+def _as_list(value: Any) -> List:
+    return [value] if isinstance(value, (str, int)) else list(value)
+
+
+def _plain(value: float):
+    """Python number for a chart; whole numbers stay ints, so labels and chart cache keys match literal specs"""
+    return int(value) if float(value).is_integer() else float(value)
+
+
+class IndicatorStore:
+    """Indicator rows of the newest version of every dataset, indexed by (indicator, geography, group, year)"""
+
+    def __init__(self, directory: str = DEFAULT_DIRECTORY, versions: Optional[Dict[str, int]] = None):
+        self.directory = directory
+        # Dataset name -> version to read instead of the newest
+        self.versions = versions or {}
+        self._frame: Optional[pd.DataFrame] = None
+        self._signature: Signature = ()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "IndicatorStore":
+        """Build a store from SEMINAR_INDICATORS_DIR (data/indicators when unset)"""
+        return cls(os.environ.get("SEMINAR_INDICATORS_DIR") or DEFAULT_DIRECTORY)
+
+    def datasets(self) -> Dict[str, Tuple[int, str]]:
+        """Dataset name -> (version, path) of the files the store reads"""
+        found: Dict[str, Dict[int, str]] = {}
+        for entry in sorted(os.listdir(self.directory)):
+            match = DATASET_FILE.match(entry)
+            if match:
+                found.setdefault(match["name"], {})[int(match["version"])] = os.path.join(self.directory, entry)
+        for name, version in self.versions.items():
+            if version not in found.get(name, {}):
+                raise ValueError(f"Indicator dataset {name} has no version {version} in {self.directory}")
+        chosen = {}
+        for name, files in found.items():
+            version = self.versions.get(name, max(files))
+            chosen[name] = (version, files[version])
+        return chosen
+
+    @staticmethod
+    def _read(name: str, version: int, path: str) -> pd.DataFrame:
+        if path.endswith(".parquet"):
+            try:
+                frame = pd.read_parquet(path)
+            except ImportError as e:
+                # pandas reads Parquet through an optional engine; report it like any unreadable dataset
+                raise ValueError(f"{path}: reading Parquet datasets needs pyarrow or fastparquet ({e})")
+        else:
+            # Only empty cells are missing values; "NA" is a geography (Namibia), not a gap
+            frame = pd.read_csv(path, memory_map=True, keep_default_na=False,
+                                na_values={"year": [""], "value": [""]})
+        missing = [column for column in REQUIRED_COLUMNS if column not in frame.columns]
+        if missing:
+            raise ValueError(f"{path}: missing columns {', '.join(missing)}")
+        frame["year"] = frame["year"].astype("Int64")
+        frame["value"] = frame["value"].astype(float)
+        frame["dataset"] = name
+        frame["version"] = version
+        return frame
+
+    def signature(self, datasets: Optional[Dict[str, Tuple[int, str]]] = None) -> Signature:
+        """(path, mtime, size) of every dataset file read; changes whenever the data does"""
+        paths = [path for _, path in (datasets or self.datasets()).values()]
+        return tuple(sorted((path, os.stat(path).st_mtime_ns, os.stat(path).st_size) for path in paths))
+
+    def frame(self) -> pd.DataFrame:
+        """Every indicator row, loaded on first use and again whenever a dataset file changes"""
+        datasets = self.datasets()
+        signature = self.signature(datasets)
+        with self._lock:
+            if self._frame is None or signature != self._signature:
+                if not datasets:
+                    raise ValueError(f"No indicator datasets in {self.directory}")
+                frame = pd.concat([self._read(name, version, path) for name, (version, path) in datasets.items()],
+                                  ignore_index=True).set_index(list(INDEX))
+                duplicated = frame.index[frame.index.duplicated()]
+                if len(duplicated):
+                    raise ValueError(f"Indicator rows defined more than once: {list(duplicated[:5])}")
+                self._frame = frame
+                self._signature = signature
+            return self._frame
+
+    def query(self, indicator: Any = None, geography: Any = None, group: Any = None, year: Any = None) -> pd.DataFrame:
+        """Rows matching every key given; each key is one value or a list of values"""
+        selected = self.frame()
+        for level, values in zip(INDEX, (indicator, geography, group, year)):
+            if values is not None:
+                selected = selected[selected.index.get_level_values(level).isin(_as_list(values))]
+        return selected
+
+    def chart_data(self, series: Dict[str, str], by: str, categories: Optional[Sequence] = None,
+                   labels: Optional[Dict[str, str]] = None, **filters) -> Dict[str, tuple]:
+        """ChartSpec categories and series: one series per indicator (name -> indicator), one category per `by` value
+
+        `filters` select on the other index columns, e.g. geography="India" or year=2021. Categories
+        default to the order of the dataset rows; `labels` renames them for display.
+        """
+        if by not in INDEX[1:]:
+            raise ValueError(f"Charts can be drawn by {', '.join(INDEX[1:])}, not {by!r}")
+        unknown = [key for key in filters if key not in INDEX[1:] or key == by]
+        if unknown:
+            raise ValueError(f"Unknown indicator filters: {', '.join(unknown)}")
+        indicators = list(series.values())
+        rows = self.query(indicator=indicators, **filters).reset_index()
+        if rows.empty:
+            raise ValueError(f"No rows for {', '.join(indicators)}")
+        if rows.duplicated(["indicator", by]).any():
+            raise ValueError(f"Several rows per {by} for {', '.join(indicators)}; narrow the query")
+
+        order = list(categories) if categories is not None else list(rows[by].unique())
+        table = rows.pivot(index=by, columns="indicator", values="value").reindex(index=order, columns=indicators)
+        gaps = [f"{indicator} for {category}" for indicator in indicators
+                for category in table.index[table[indicator].isna()]]
+        if gaps:
+            raise ValueError(f"No indicator values: {', '.join(gaps)}")
+        labels = labels or {}
+        return {
+            "categories": tuple(labels.get(str(category), str(category)) for category in table.index),
+            "series": tuple((name, tuple(_plain(value) for value in table[indicator].tolist()))
+                            for name, indicator in series.items())
+        }
+
+
+# Shared by the chart scripts and every deck spec that queries indicators
+default_store = IndicatorStore.from_env()
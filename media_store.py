@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Content-addressed media store for the PG Seminar Presentation Generator
+Images embedded in decks are read once, hashed, and kept by their SHA-1, so
+every slide and every deck rendered in the process reuses the same encoded
+bytes. With a directory (SEMINAR_MEDIA_DIR) the blobs are also kept on disk,
+where other processes such as batch workers find them. Optimized variants
+(see image_optimizer) are cached by source hash and display size, so an
+image is re-encoded once per size rather than once per deck.
+"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from image_optimizer import OPTIMIZER_VERSION, display_pixels, optimize_image
+from pptx_streaming import atomic_write
+
+DEFAULT_MAX_MEMORY_BYTES = 64 * 1024 * 1024
+
+SourceKey = Tuple[str, int, int]
+
+
+@dataclass(frozen=True)
+class MediaItem:
+    digest: str
+    ext: str
+    blob: bytes
+
+
+class MediaStore:
+    """Image blobs keyed by content hash, with an in-memory LRU in front of an optional directory"""
+
+    def __init__(self, directory: Optional[str] = None, max_memory_bytes: int = DEFAULT_MAX_MEMORY_BYTES):
+        self.directory = directory
+        self.max_memory_bytes = max_memory_bytes
+        self._items: "OrderedDict[str, MediaItem]" = OrderedDict()
+        self._memory_bytes = 0
+        # Source file (path, mtime, size) -> digest, so unchanged files are not re-read
+        self._sources: Dict[SourceKey, str] = {}
+        # Variant key -> (digest, ext) of the optimized image
+        self._variants: Dict[str, Tuple[str, str]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "MediaStore":
+        """Build a store from SEMINAR_MEDIA_DIR (memory only when unset)"""
+        return cls(directory=os.environ.get("SEMINAR_MEDIA_DIR") or None)
+
+    def _path(self, digest: str, ext: str) -> str:
+        return os.path.join(self.directory, digest[:2], f"{digest}.{ext}")
+
+    def _remember(self, item: MediaItem) -> None:
+        with self._lock:
+            if item.digest in self._items:
+                self._items.move_to_end(item.digest)
+                return
+            self._items[item.digest] = item
+            self._memory_bytes += len(item.blob)
+            while self._memory_bytes > self.max_memory_bytes and len(self._items) > 1:
+                _, evicted = self._items.popitem(last=False)
+                self._memory_bytes -= len(evicted.blob)
+
+    def put(self, blob: bytes, ext: str) -> MediaItem:
+        """Store encoded image bytes and return them with their digest"""
+        ext = ext.lower().lstrip(".")
+        item = MediaItem(hashlib.sha1(blob).hexdigest(), ext, blob)
+        self._remember(item)
+        if self.directory:
+            path = self._path(item.digest, ext)
+            if not os.path.exists(path):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                atomic_write(path, lambda f: f.write(blob))
+        return item
+
+    def get(self, digest: str, ext: str) -> Optional[MediaItem]:
+        """Return a stored blob, from memory or from the store's directory, or None"""
+        with self._lock:
+            item = self._items.get(digest)
+            if item is not None:
+                self._items.move_to_end(digest)
+                return item
+        if not self.directory:
+            return None
+        try:
+            with open(self._path(digest, ext), "rb") as f:
+                blob = f.read()
+        except OSError:
+            return None
+        item = MediaItem(digest, ext.lower().lstrip("."), blob)
+        self._remember(item)
+        return item
+
+    def load(self, path: str) -> MediaItem:
+        """Load an image file through the store; unchanged files are read only once"""
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        source = (path, stat.st_mtime_ns, stat.st_size)
+        ext = os.path.splitext(path)[1].lstrip(".") or "bin"
+        digest = self._sources.get(source)
+        if digest is not None:
+            item = self.get(digest, ext)
+            if item is not None:
+                return item
+        with open(path, "rb") as f:
+            item = self.put(f.read(), ext)
+        self._sources[source] = item.digest
+        return item
+
+    def _variant_path(self, key: str) -> str:
+        return os.path.join(self.directory, "variants", key[:2], key)
+
+    def _get_variant(self, key: str) -> Optional[MediaItem]:
+        found = self._variants.get(key)
+        if found is None and self.directory:
+            try:
+                with open(self._variant_path(key), encoding="utf-8") as f:
+                    found = tuple(f.read().split())
+            except OSError:
+                return None
+        return self.get(*found) if found else None
+
+    def _put_variant(self, key: str, item: MediaItem) -> None:
+        self._variants[key] = (item.digest, item.ext)
+        if self.directory:
+            path = self._variant_path(key)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            atomic_write(path, lambda f: f.write(f"{item.digest} {item.ext}".encode("utf-8")))
+
+    def optimized(self, path: str, width: float, height: Optional[float], dpi: int) -> MediaItem:
+        """Load an image re-encoded for display at `width` x `height` inches (None keeps the aspect ratio)"""
+        source = self.load(path)
+        size = display_pixels(source.blob, width, height, dpi)
+        key = hashlib.sha1(f"{OPTIMIZER_VERSION}:{source.digest}:{size[0]}x{size[1]}".encode("utf-8")).hexdigest()
+        item = self._get_variant(key)
+        if item is None:
+            item = self.put(*optimize_image(source.blob, size))
+            self._put_variant(key, item)
+        return item
+
+
+# Shared by every DeckRenderer in the process
+default_store = MediaStore.from_env()
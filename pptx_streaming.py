@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+Streaming OOXML package writer for the PG Seminar Presentation Generator
+python-pptx keeps every slide, chart and embedded workbook in memory until
+Presentation.save(). StreamingPackageWriter instead writes each slide and the
+parts it created into the output zip as soon as the slide is finished, then
+detaches it from the presentation, so peak memory follows one slide rather
+than the whole deck. The template parts, presentation.xml, the package
+relationships and [Content_Types].xml are written by close().
+
+Slides can also be given a stable name (a content hash), which names their
+parts after it instead of by position; such slides can later be copied
+verbatim from a previous output with copy_slide().
+
+Images are deduplicated by content hash across the whole package: a picture
+already written for an earlier slide is referenced again rather than stored
+twice.
+"""
+
+import hashlib
+import os
+import re
+import uuid
+import zipfile
+from contextlib import contextmanager
+from typing import IO, Any, Callable, Dict, Iterator, List, Optional, Set, Union
+
+from pptx.opc.constants import CONTENT_TYPE as CT
+from pptx.opc.constants import RELATIONSHIP_TARGET_MODE as RTM
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.oxml import CT_Types, serialize_part_xml
+from pptx.opc.package import Part, _Relationship
+from pptx.opc.packuri import CONTENT_TYPES_URI, PACKAGE_URI, PackURI
+from pptx.opc.spec import default_content_types
+
+Output = Union[str, IO[bytes]]
+
+_PARTNAME_NUMBER = re.compile(r"\d*(?=\.[^./]+$)")
+
+
+def _is_media(part: Part) -> bool:
+    return part.partname.startswith("/ppt/media/")
+
+
+def atomic_write(path: str, write: Callable[[IO[bytes]], None]) -> None:
+    """Write a file through a uniquely named sibling and rename it into place
+
+    Concurrent writers of the same path never interleave, and readers only ever
+    see a complete file.
+    """
+    tmp_path = f"{path}.{os.getpid()}-{uuid.uuid4().hex[:8]}.tmp"
+    try:
+        with open(tmp_path, "xb") as f:
+            write(f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _iter_graph(start: Part) -> Iterator[Part]:
+    """Yield every part reachable from `start` through internal relationships, including `start`"""
+    visited: Set[Part] = set()
+    pending = [start]
+    while pending:
+        part = pending.pop()
+        if part in visited:
+            continue
+        visited.add(part)
+        yield part
+        pending.extend(rel.target_part for rel in part.rels.values() if not rel.is_external)
+
+
+class StreamingPackageWriter:
+    """Write a presentation's slides straight into a .pptx zip, one slide at a time
+
+    The Presentation is consumed: slides added through slide() are removed from
+    it once written, and close() leaves it pointing at the streamed slides.
+    """
+
+    def __init__(self, prs, output: Output):
+        self.prs = prs
+        self.output = output
+        self._zip = zipfile.ZipFile(output, "w", compression=zipfile.ZIP_DEFLATED, strict_timestamps=False)
+        self._content_types: Dict[PackURI, str] = {}
+        self._slide_partnames: List[PackURI] = []
+        self._partnames: Set[str] = {str(part.partname) for part in prs.part.package.iter_parts()}
+        self._written: Set[str] = set()
+        self._counters: Dict[str, int] = {}
+        # Content hash -> stand-in for the media part already written with that content
+        self._media: Dict[str, Part] = {}
+        # One {"partname", "parts": {partname: content type}} entry per written slide
+        self.slides: List[Dict[str, Any]] = []
+
+    def _next_partname(self, partname: PackURI, name: Optional[str] = None) -> PackURI:
+        """Number new parts past everything already written, e.g. /ppt/charts/chart7.xml"""
+        suffix = f"-{name}-%d" if name else "%d"
+        pattern = _PARTNAME_NUMBER.sub(suffix, str(partname), count=1)
+        while True:
+            self._counters[pattern] = self._counters.get(pattern, 0) + 1
+            candidate = pattern % self._counters[pattern]
+            if candidate not in self._partnames:
+                self._partnames.add(candidate)
+                return PackURI(candidate)
+
+    def _write_member(self, member: str, blob: bytes) -> None:
+        self._zip.writestr(member, blob)
+        self._written.add(member)
+
+    def _write_part(self, part: Part) -> None:
+        self._write_member(part.partname.membername, part.blob)
+        if part.rels:
+            self._write_member(part.partname.rels_uri.membername, part.rels.xml)
+        self._content_types[part.partname] = part.content_type
+
+    def _share_media(self, new_parts: List[Part], name: Optional[str]) -> List[Part]:
+        """Point relationships to images already in the package at the written copy
+
+        Returns the media parts the slide uses that were written before it. New media
+        of a named slide is named after its content hash, so it keeps its partname
+        whichever slide first embeds it.
+        """
+        shared: Dict[Part, Part] = {}
+        for part in new_parts:
+            if not _is_media(part):
+                continue
+            digest = hashlib.sha1(part.blob).hexdigest()
+            if digest in self._media:
+                shared[part] = self._media[digest]
+                continue
+            if name:
+                part.partname = PackURI(f"/ppt/media/image-{digest[:16]}.{part.partname.ext}")
+                self._partnames.add(str(part.partname))
+            else:
+                part.partname = self._next_partname(part.partname)
+            self._media[digest] = Part(part.partname, part.content_type, part.package)
+        for part in new_parts:
+            rels = part.rels
+            for rId, rel in list(rels.items()):
+                if not rel.is_external and rel.target_part in shared:
+                    # Relationships cache their target, so swap in a new one under the same rId
+                    rels._rels[rId] = _Relationship(rels._base_uri, rId, rel.reltype, RTM.INTERNAL,
+                                                    shared[rel.target_part])
+        return list(shared.values())
+
+    @contextmanager
+    def slide(self, layout, name: Optional[str] = None):
+        """Add a slide on `layout` for the caller to fill, then write it out and detach it
+
+        With `name`, the slide and its parts are named after it (/ppt/slides/slide-<name>.xml)
+        so they keep the same partnames wherever the slide moves in later builds.
+        """
+        prs_part = self.prs.part
+        slide = self.prs.slides.add_slide(layout)
+        yield slide
+
+        # Detach the finished slide so nothing in the presentation keeps it alive
+        rId = prs_part.relate_to(slide.part, RT.SLIDE)
+        sld_id_lst = prs_part._element.get_or_add_sldIdLst()
+        for sld_id in sld_id_lst.sldId_lst:
+            if sld_id.rId == rId:
+                sld_id_lst.remove(sld_id)
+        prs_part.drop_rel(rId)
+
+        # Parts still reachable from the presentation (layouts, notes master) are written by close()
+        shared = set(prs_part.package.iter_parts())
+        new_parts = [part for part in _iter_graph(slide.part) if part not in shared]
+
+        # Rename everything before serializing, since relationship targets are derived from partnames
+        reused_media = self._share_media(new_parts, name)
+        new_parts = [part for part in _iter_graph(slide.part) if part not in shared and part not in reused_media]
+        if name:
+            slide_partname = PackURI(f"/ppt/slides/slide-{name}.xml")
+        else:
+            slide_partname = PackURI(f"/ppt/slides/slide{len(self._slide_partnames) + 1}.xml")
+        self._partnames.add(str(slide_partname))
+        for part in new_parts:
+            if part is slide.part:
+                part.partname = slide_partname
+            elif not _is_media(part):
+                part.partname = self._next_partname(part.partname, name)
+        for part in new_parts:
+            self._write_part(part)
+        self._slide_partnames.append(slide_partname)
+        # Entries list shared media too, so a copied slide always brings the images it needs
+        self.slides.append({
+            "partname": str(slide_partname),
+            "parts": {str(part.partname): part.content_type for part in new_parts + reused_media}
+        })
+
+    def copy_slide(self, source: zipfile.ZipFile, entry: Dict[str, Any]) -> None:
+        """Copy a slide written by an earlier build, given its entry from that writer's `slides`
+
+        Raises KeyError, before writing anything, when a part is missing from `source`.
+        """
+        members = []
+        for partname, content_type in entry["parts"].items():
+            packuri = PackURI(partname)
+            if packuri.membername in self._written:
+                # Media shared with a slide that is already in the package
+                continue
+            members.append((packuri, source.read(packuri.membername), content_type))
+            rels_member = packuri.rels_uri.membername
+            if rels_member in source.NameToInfo:
+                members.append((packuri.rels_uri, source.read(rels_member), None))
+
+        for packuri, blob, content_type in members:
+            self._write_member(packuri.membername, blob)
+            if packuri.startswith("/ppt/media/"):
+                # Later slides embedding the same image refer to this copy
+                stand_in = Part(packuri, content_type, self.prs.part.package)
+                self._media.setdefault(hashlib.sha1(blob).hexdigest(), stand_in)
+        for partname, content_type in entry["parts"].items():
+            self._partnames.add(partname)
+            self._content_types[PackURI(partname)] = content_type
+            if content_type == CT.PML_NOTES_SLIDE:
+                # Copied notes slides point at the notes master, which fresh clones do not have yet
+                self.prs.notes_master
+        self._slide_partnames.append(PackURI(entry["partname"]))
+        self.slides.append(entry)
+
+    def close(self) -> None:
+        """Write the shared parts, presentation.xml, package relationships and content types"""
+        prs_part = self.prs.part
+        package = prs_part.package
+        sld_id_lst = prs_part._element.get_or_add_sldIdLst()
+        # Slides are already in the zip; empty stand-in parts only carry their partnames
+        streamed = set()
+        for partname in self._slide_partnames:
+            stand_in = Part(partname, CT.PML_SLIDE, package)
+            sld_id_lst.add_sldId(prs_part.relate_to(stand_in, RT.SLIDE))
+            streamed.add(stand_in)
+            self._content_types[partname] = CT.PML_SLIDE
+
+        for part in package.iter_parts():
+            if part not in streamed:
+                self._write_part(part)
+        self._write_member(PACKAGE_URI.rels_uri.membername, package._rels.xml)
+        self._write_member(CONTENT_TYPES_URI.membername, serialize_part_xml(self._content_types_xml()))
+        self._zip.close()
+
+    def abort(self) -> None:
+        """Close the zip after a failure and remove the partial file when writing to a path"""
+        self._zip.close()
+        if isinstance(self.output, str) and os.path.exists(self.output):
+            os.remove(self.output)
+
+    def _content_types_xml(self):
+        defaults = {"rels": CT.OPC_RELATIONSHIPS, "xml": CT.XML}
+        overrides = {}
+        for partname, content_type in self._content_types.items():
+            if (partname.ext.lower(), content_type) in default_content_types:
+                defaults[partname.ext] = content_type
+            else:
+                overrides[partname] = content_type
+
+        types = CT_Types.new()
+        for ext, content_type in sorted(defaults.items()):
+            types.add_default(ext, content_type)
+        for partname, content_type in sorted(overrides.items()):
+            types.add_override(partname, content_type)
+        return types
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+Batch generation for the PG Seminar Presentation Generator
+Reads a CSV or JSON manifest of topics and generates every deck in a pool of
+worker processes sized to the machine. Workers share the SQLite research
+cache and split the upstream rate limits between them. A JSON report with
+per-topic stage timings and failures is written next to the outputs.
+
+Manifest columns/keys: topic (required), slides (10-50, default 20),
+variant ("full" for slides and visuals, "slides" for slides only)
+
+Usage: python batch_generate.py syllabus.csv [--output-dir batch_output] [--workers N] [--report FILE]
+"""
+
+import argparse
+import asyncio
+import csv
+import hashlib
+import json
+import multiprocessing
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Dict, List, Optional, Sequence
+
+VARIANTS = {"full": True, "slides": False}
+# Written by the renderers into each job's directory
+OUTPUT_EXTENSIONS = (".pptx", ".png")
+DEFAULT_SLIDES = 20
+MIN_SLIDES = 10
+MAX_SLIDES = 50
+
+# Exit status when every deck was written but some lack research or visuals
+EXIT_DEGRADED = 3
+
+# Per-worker state, set up once by _init_worker
+_worker: Dict[str, Any] = {}
+
+
+class ManifestError(ValueError):
+    """Raised when the topic manifest is malformed; the message names the offending row"""
+
+
+def _parse_job(row: Dict[str, Any], where: str) -> Dict[str, Any]:
+    topic = str(row.get("topic") or "").strip()
+    if not topic:
+        raise ManifestError(f"{where}: topic is required")
+
+    slides = row.get("slides") or DEFAULT_SLIDES
+    try:
+        slides = int(slides)
+    except (TypeError, ValueError):
+        raise ManifestError(f"{where}: slides must be a whole number, got {slides!r}")
+    if not MIN_SLIDES <= slides <= MAX_SLIDES:
+        raise ManifestError(f"{where}: slides must be between {MIN_SLIDES} and {MAX_SLIDES}")
+
+    variant = str(row.get("variant") or "full").strip().lower()
+    if variant not in VARIANTS:
+        raise ManifestError(f"{where}: variant must be one of {', '.join(VARIANTS)}")
+    return {"topic": topic, "slides": slides, "variant": variant}
+
+
+def load_manifest(path: str) -> List[Dict[str, Any]]:
+    """Read jobs from a CSV file with a header row, or a JSON list (optionally under "topics")"""
+    with open(path, encoding="utf-8", newline="") as f:
+        if path.lower().endswith(".json"):
+            data = json.load(f)
+            rows = data.get("topics") if isinstance(data, dict) else data
+            if not isinstance(rows, list):
+                raise ManifestError(f"{path}: expected a list of topics")
+        else:
+            rows = list(csv.DictReader(f))
+
+    jobs = []
+    seen = set()
+    for i, row in enumerate(rows):
+        where = f"{os.path.basename(path)}[{i}]"
+        if isinstance(row, str):
+            row = {"topic": row}
+        if not isinstance(row, dict):
+            raise ManifestError(f"{where}: must be an object or a topic string")
+        job = _parse_job(row, where)
+        key = (job["topic"].lower(), job["variant"])
+        if key in seen:
+            raise ManifestError(f"{where}: duplicate topic {job['topic']!r} for variant {job['variant']!r}")
+        seen.add(key)
+        jobs.append(job)
+    if not jobs:
+        raise ManifestError(f"{path}: no topics listed")
+    return jobs
+
+
+def job_directory(output_dir: str, job: Dict[str, Any]) -> str:
+    """<output_dir>/<topic slug>-<hash>/<variant>, a directory of its own for every manifest entry"""
+    slug = re.sub(r"[^A-Za-z0-9]+", "_", job["topic"]).strip("_") or "topic"
+    # Topics can share a slug ("COVID-19" and "COVID 19", or any two non-ASCII topics), and run_job
+    # empties its directory first; hashing the topic as load_manifest compares it keeps them apart
+    digest = hashlib.sha1(job["topic"].lower().encode("utf-8")).hexdigest()[:8]
+    return os.path.join(output_dir, f"{slug}-{digest}", job["variant"])
+
+
+def _init_worker(workers: int) -> None:
+    """Open the shared research cache once per worker process"""
+    # Each worker renders its own job in-process; a nested render pool per worker would oversubscribe the cores
+    os.environ["SEMINAR_RENDER_WORKERS"] = "0"
+    # Pay for the lazily imported HTTP and rendering stacks before the first job is timed
+    import mcp_server
+    mcp_server.warm_imports(mcp_server.HTTP_MODULES + mcp_server.RENDER_MODULES)
+    from research_cache import ResearchCache
+
+    try:
+        _worker["cache"] = ResearchCache.from_env()
+    except Exception as e:
+        print(f"Research cache disabled: {str(e)}", file=sys.stderr)
+        _worker["cache"] = None
+    _worker["rate_share"] = 1.0 / workers
+
+
+async def _generate(job: Dict[str, Any]) -> Dict[str, Any]:
+    from mcp_server import SeminarGeneratorServer
+
+    stages: Dict[str, int] = {}
+
+    async def collect(message: Dict[str, Any]) -> None:
+        meta = message["params"].get("_meta", {})
+        if meta.get("event") == "finished":
+            stages[meta["stage"]] = meta["stageMs"]
+
+    async with SeminarGeneratorServer(cache=_worker["cache"], rate_share=_worker["rate_share"]) as server:
+        server.notify = collect
+        response = await server.generate_seminar_materials(
+            {"topic": job["topic"], "slides": job["slides"], "includeVisuals": VARIANTS[job["variant"]]},
+            request_id=job["topic"],
+            progress_token="batch"
+        )
+    error = response.get("error")
+    warnings = (response.get("result") or {}).get("_meta", {}).get("warnings", [])
+    return {"error": error["message"] if error else None, "warnings": warnings, "stages": stages}
+
+
+def run_job(job: Dict[str, Any], directory: str) -> Dict[str, Any]:
+    """Generate one deck inside a worker; outputs land in the job's own directory"""
+    started = time.perf_counter()
+    os.makedirs(directory, exist_ok=True)
+    # Outputs of an earlier run must not pass for this run's
+    for name in os.listdir(directory):
+        if name.endswith(OUTPUT_EXTENSIONS):
+            os.remove(os.path.join(directory, name))
+    # Renderers write to the working directory, and each worker runs one job at a time
+    os.chdir(directory)
+    try:
+        outcome = asyncio.run(_generate(job))
+    except Exception as e:
+        outcome = {"error": f"{type(e).__name__}: {str(e)}", "warnings": [], "stages": {}}
+
+    files = sorted(name for name in os.listdir(directory) if not name.startswith("."))
+    error = outcome["error"]
+    if error is None and not any(name.endswith(".pptx") for name in files):
+        error = "No presentation was written"
+    # A deck built without research or visuals is written, but degraded
+    status = "failed" if error else "warning" if outcome["warnings"] else "ok"
+    return dict(
+        job,
+        status=status,
+        error=error,
+        warnings=outcome["warnings"],
+        seconds=round(time.perf_counter() - started, 3),
+        stages=outcome["stages"],
+        directory=directory,
+        files=files
+    )
+
+
+def run_batch(jobs: Sequence[Dict[str, Any]], output_dir: str,
+              workers: Optional[int] = None) -> Dict[str, Any]:
+    """Fan the jobs out over a process pool and return the batch report"""
+    output_dir = os.path.abspath(output_dir)
+    workers = max(1, min(workers or os.cpu_count() or 1, len(jobs)))
+    started = time.perf_counter()
+    results: List[Optional[Dict[str, Any]]] = [None] * len(jobs)
+
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"),
+                             initializer=_init_worker, initargs=(workers,)) as pool:
+        futures = {pool.submit(run_job, job, job_directory(output_dir, job)): i for i, job in enumerate(jobs)}
+        for done, future in enumerate(as_completed(futures), start=1):
+            job = jobs[futures[future]]
+            try:
+                result = future.result()
+            except Exception as e:
+                # The worker itself died (e.g. killed for memory); report it like any other failure
+                result = dict(job, status="failed", error=f"{type(e).__name__}: {str(e)}", warnings=[],
+                              seconds=None, stages={}, directory=job_directory(output_dir, job), files=[])
+            results[futures[future]] = result
+            detail = {"ok": f"{result['seconds']}s", "failed": result["error"]}.get(
+                result["status"], "; ".join(result["warnings"]))
+            print(f"[{done}/{len(jobs)}] {job['topic']} ({job['variant']}): {result['status']} {detail}",
+                  file=sys.stderr)
+
+    statuses = [r["status"] for r in results]
+    return {
+        "workers": workers,
+        "seconds": round(time.perf_counter() - started, 3),
+        "succeeded": statuses.count("ok"),
+        "warnings": statuses.count("warning"),
+        "failed": statuses.count("failed"),
+        "jobs": results
+    }
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Generate seminar decks for every topic in a manifest")
+    parser.add_argument("manifest", help="CSV (topic,slides,variant) or JSON manifest of topics")
+    parser.add_argument("--output-dir", default="batch_output", help="Root directory for generated decks")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: one per core)")
+    parser.add_argument("--report", default=None, help="Report path (default: OUTPUT_DIR/batch_report.json)")
+    args = parser.parse_args(argv)
+
+    try:
+        jobs = load_manifest(args.manifest)
+    except (OSError, ValueError) as e:
+        print(f"Invalid manifest: {e}", file=sys.stderr)
+        return 2
+
+    report = run_batch(jobs, args.output_dir, args.workers)
+    report_path = args.report or os.path.join(args.output_dir, "batch_report.json")
+    os.makedirs(os.path.dirname(os.path.abspath(report_path)), exist_ok=True)
+    with open(report_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+    degraded = f" ({report['warnings']} degraded)" if report["warnings"] else ""
+    print(f"{report['succeeded'] + report['warnings']} of {len(jobs)} decks generated{degraded} in {report['seconds']}s "
+          f"with {report['workers']} workers; report: {report_path}")
+    for result in report["jobs"]:
+        if result["status"] == "failed":
+            print(f"  FAILED {result['topic']} ({result['variant']}): {result['error']}")
+        elif result["status"] == "warning":
+            print(f"  DEGRADED {result['topic']} ({result['variant']}): {'; '.join(result['warnings'])}")
+    if report["failed"]:
+        return 1
+    return EXIT_DEGRADED if report["warnings"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
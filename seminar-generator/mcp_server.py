@@ -5,19 +5,151 @@ Replaces the TypeScript version with a pure Python implementation
 """
 
 import asyncio
+import importlib
+import io
 import json
+import multiprocessing
 import os
+import subprocess
 import sys
-from typing import Any, Dict, List, Optional
-import aiohttp
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import asynccontextmanager
+from typing import IO, Any, Awaitable, Callable, Dict, List, Optional
+from urllib.parse import quote, urlsplit
 import xml.etree.ElementTree as ET
-from pptx import Presentation
-from pptx.util import Inches
-import matplotlib.pyplot as plt
-import numpy as np
+
+# Rendering modules shared with the deck engine live at the repository root
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pubmed_parser import PubmedArticleParser
+from research_cache import MISSING, ResearchCache, normalize_topic
+from research_transport import create_transport
+from resilience import ResilientFetcher, UpstreamError
+
+WIKIPEDIA_SUMMARY_URL = "https://en.wikipedia.org/api/rest_v1/page/summary"
+EUTILS_BASE_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils"
+PUBMED_RETMAX = 3
+EFETCH_GET_MAX_IDS = 200
+DEFAULT_RENDER_WORKERS = 4
+# Tool calls processed at once
+DEFAULT_MAX_CONCURRENCY = 4
+
+# NCBI allows 3 requests/second per client, or 10 with an API key
+NCBI_RATE_LIMIT = 3
+NCBI_RATE_LIMIT_WITH_KEY = 10
+WIKIPEDIA_RATE_LIMIT = 50
+
+# Imported on first use rather than at startup, so that initialize and tools/list are
+# answered before the HTTP client and the rendering stack have loaded
+HTTP_MODULES = ("aiohttp",)
+RENDER_MODULES = ("pptx", "template_pool", "text_fit", "text_frames", "pptx_streaming")
+CHART_MODULES = ("charts", "matplotlib.figure", "matplotlib.backends.backend_agg")
+# Reported by --import-times when any of them is loaded by importing this module
+HEAVY_PACKAGES = ("aiohttp", "pptx", "lxml", "matplotlib", "numpy", "PIL", "pandas")
+# Import of this module plus the initialize and tools/list round trip
+STARTUP_BUDGET_MS = 150
+
+
+class OfflineCacheMiss(Exception):
+    """Raised in offline mode when research is not available from the cache"""
+
+
+class ProgressReporter:
+    """Time pipeline stages and emit MCP notifications/progress for a request's progressToken"""
+
+    def __init__(self, notify: Optional[Callable[[Dict[str, Any]], Awaitable[None]]],
+                 progress_token: Any, total: int):
+        self.notify = notify if progress_token is not None else None
+        self.progress_token = progress_token
+        self.total = total
+        self.progress = 0
+        self.started = time.perf_counter()
+        self.timings: Dict[str, int] = {}
+
+    def elapsed_ms(self) -> int:
+        return int((time.perf_counter() - self.started) * 1000)
+
+    async def _emit(self, stage: str, event: str, stage_ms: Optional[int] = None) -> None:
+        self.progress += 1
+        if self.notify is None:
+            return
+        elapsed = self.elapsed_ms()
+        message = f"{stage} {event} at {elapsed} ms"
+        if stage_ms is not None:
+            message += f" ({stage_ms} ms)"
+        meta = {"stage": stage, "event": event, "elapsedMs": elapsed}
+        if stage_ms is not None:
+            meta["stageMs"] = stage_ms
+        try:
+            await self.notify({
+                "jsonrpc": "2.0",
+                "method": "notifications/progress",
+                "params": {
+                    "progressToken": self.progress_token,
+                    "progress": self.progress,
+                    "total": self.total,
+                    "message": message,
+                    "_meta": meta
+                }
+            })
+        except Exception as e:
+            # Progress is best effort and must never fail the request
+            print(f"Progress notification failed: {str(e)}", file=sys.stderr)
+
+    @asynccontextmanager
+    async def stage(self, name: str):
+        """Emit start/finish notifications around a pipeline stage and record its duration"""
+        await self._emit(name, "started")
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = int((time.perf_counter() - start) * 1000)
+            await self._emit(name, "finished", self.timings[name])
+
+    def summary(self) -> str:
+        stages = " ".join(f"{name}={ms}ms" for name, ms in self.timings.items())
+        return f"{stages} total={self.elapsed_ms()}ms"
+
 
 class SeminarGeneratorServer:
-    def __init__(self):
+    def __init__(self, pubmed_retmax: Optional[int] = None, cache: Optional[ResearchCache] = None,
+                 offline: Optional[bool] = None, transport: Any = None, rate_share: float = 1.0):
+        # Set by the dispatcher so that long requests can send notifications/progress
+        self.notify: Optional[Callable[[Dict[str, Any]], Awaitable[None]]] = None
+        # live, record or replay; see research_transport.py
+        self.transport = transport if transport is not None else create_transport()
+        self.pubmed_retmax = pubmed_retmax or int(os.environ.get("SEMINAR_PUBMED_RETMAX", PUBMED_RETMAX))
+        self.offline = offline if offline is not None else os.environ.get("SEMINAR_OFFLINE", "").lower() in ("1", "true", "yes")
+        self._owns_cache = cache is None
+        if not getattr(self.transport, "caches_research", True):
+            # record and replay always go through the transport
+            cache = None
+        elif cache is None:
+            try:
+                cache = ResearchCache.from_env()
+            except Exception as e:
+                print(f"Research cache disabled: {str(e)}", file=sys.stderr)
+        self.cache = cache
+        # One in-flight research task per normalized topic, shared by concurrent callers
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.render_workers = int(os.environ.get("SEMINAR_RENDER_WORKERS", min(DEFAULT_RENDER_WORKERS, os.cpu_count() or 1)))
+        self._render_pool: Optional[ProcessPoolExecutor] = None
+        self.warm_up_enabled = os.environ.get("SEMINAR_WARMUP", "1").lower() not in ("0", "false", "no")
+        self._warm_up: Optional[asyncio.Future] = None
+        self.ncbi_api_key = os.environ.get("NCBI_API_KEY")
+        # rate_share < 1 when several servers run side by side (e.g. batch workers) and split the limits
+        ncbi_rate = NCBI_RATE_LIMIT_WITH_KEY if self.ncbi_api_key else NCBI_RATE_LIMIT
+        self.http = ResilientFetcher(
+            self.transport.send,
+            host_rates={
+                urlsplit(EUTILS_BASE_URL).netloc: ncbi_rate * rate_share,
+                urlsplit(WIKIPEDIA_SUMMARY_URL).netloc: WIKIPEDIA_RATE_LIMIT * rate_share
+            },
+            retries=int(os.environ.get("SEMINAR_HTTP_RETRIES", 3))
+        )
         self.capabilities = {
             "tools": {
                 "generate_seminar_materials": {
@@ -46,6 +178,24 @@ class SeminarGeneratorServer:
             }
         }
 
+    async def close(self) -> None:
+        """Release pooled connections held by the server"""
+        if self._warm_up is not None and not self._warm_up.done():
+            self._warm_up.cancel()
+        await self.transport.close()
+        if self._render_pool is not None:
+            self._render_pool.shutdown(wait=False)
+            self._render_pool = None
+        if self._owns_cache and self.cache is not None:
+            self.cache.close()
+            self.cache = None
+
+    async def __aenter__(self) -> "SeminarGeneratorServer":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
     async def handle_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """Handle incoming MCP requests"""
         method = request.get("method")
@@ -79,7 +229,8 @@ class SeminarGeneratorServer:
             if tool_name == "generate_seminar_materials":
                 return await self.generate_seminar_materials(
                     params.get("arguments", {}),
-                    request.get("id")
+                    request.get("id"),
+                    (params.get("_meta") or {}).get("progressToken")
                 )
             else:
                 return {
@@ -101,7 +252,8 @@ class SeminarGeneratorServer:
                 }
             }
 
-    async def generate_seminar_materials(self, args: Dict[str, Any], request_id: Any) -> Dict[str, Any]:
+    async def generate_seminar_materials(self, args: Dict[str, Any], request_id: Any,
+                                         progress_token: Any = None) -> Dict[str, Any]:
         """Generate seminar materials based on the provided arguments"""
         try:
             topic = args.get("topic")
@@ -118,19 +270,42 @@ class SeminarGeneratorServer:
                     }
                 }
 
-            # Research the topic
-            research_data = await self.research_topic(topic)
+            # Two notifications (started/finished) per stage
+            progress = ProgressReporter(self.notify, progress_token, total=8 if include_visuals else 6)
+
+            # Research the topic; sources that failed are reported as warnings
+            async with progress.stage("research"):
+                wikipedia, pubmed = await self.gather_research(topic)
+                research_data = self.format_research(topic, wikipedia, pubmed)
+            warnings = self.research_warnings(wikipedia, pubmed)
 
             # Generate content
-            content = self.generate_content(topic, research_data, slides)
+            async with progress.stage("content"):
+                content = self.generate_content(topic, research_data, slides)
 
-            # Create PPTX
-            pptx_path = self.create_pptx(topic, content, slides)
+            async def render_stage(name: str, func, *func_args) -> Any:
+                async with progress.stage(name):
+                    return await self.run_render(func, *func_args)
+
+            # Create PPTX and visualizations in the render pool; the loop only orchestrates
+            stages = [render_stage("pptx", render_pptx, topic, content, slides)]
+            if include_visuals:
+                stages.append(render_stage("visuals", render_visualizations, topic))
+            rendered = await asyncio.gather(*stages, return_exceptions=True)
+            if isinstance(rendered[0], BaseException):
+                raise rendered[0]
+            pptx_path = rendered[0]
 
-            # Generate visualizations if requested
+            # A deck without its visuals is still returned, with a warning
             visuals_info = ""
             if include_visuals:
-                visuals_info = self.generate_visualizations(topic, research_data)
+                if isinstance(rendered[1], BaseException):
+                    visuals_info = f"Visualization generation failed: {str(rendered[1])}"
+                    warnings.append(visuals_info)
+                else:
+                    visuals_info = rendered[1]
+
+            print(f"generate_seminar_materials [{topic}] {progress.summary()}", file=sys.stderr)
 
             result = f"""Seminar materials generated successfully!
 
@@ -147,7 +322,7 @@ class SeminarGeneratorServer:
 
 The presentation includes comprehensive content based on current research and evidence-based information."""
 
-            return {
+            response = {
                 "jsonrpc": "2.0",
                 "id": request_id,
                 "result": {
@@ -159,6 +334,10 @@ The presentation includes comprehensive content based on current research and ev
                     ]
                 }
             }
+            if warnings:
+                # Machine-readable for callers such as batch_generate
+                response["result"]["_meta"] = {"warnings": warnings}
+            return response
 
         except Exception as e:
             return {
@@ -172,67 +351,161 @@ The presentation includes comprehensive content based on current research and ev
 
     async def research_topic(self, topic: str) -> str:
         """Research the topic using Wikipedia and PubMed"""
-        research = f"=== Research Summary for: {topic} ===\n\n"
+        wikipedia, pubmed = await self.gather_research(topic)
+        return self.format_research(topic, wikipedia, pubmed)
+
+    async def gather_research(self, topic: str) -> tuple:
+        """Return (wikipedia, pubmed) research, with exceptions in place of sources that failed"""
+        # Both sources are independent, so fetch them concurrently
+        key = normalize_topic(topic)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._gather_research(key, topic))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        # Shield the shared task so one caller going away does not cancel the others
+        return await asyncio.shield(task)
+
+    async def _gather_research(self, key: str, topic: str) -> tuple:
+        """Fetch both research sources concurrently, returning exceptions in place of results"""
+        return await asyncio.gather(
+            self.cached_fetch("wikipedia", key, self.fetch_wikipedia, topic),
+            self.cached_fetch("pubmed", f"{key}#retmax={self.pubmed_retmax}", self.fetch_pubmed, topic),
+            return_exceptions=True
+        )
+
+    async def cached_fetch(self, source: str, key: str, fetch, topic: str) -> Any:
+        """Serve a research source from the cache, fetching and storing it on a miss"""
+        loop = asyncio.get_event_loop()
+        if self.cache is not None:
+            cached = await loop.run_in_executor(None, self.cache.get, source, key, self.offline)
+            if cached is not MISSING:
+                return cached
+
+        if self.offline:
+            raise OfflineCacheMiss(f"offline mode and no cached {source} data")
 
-        # Wikipedia research
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"https://en.wikipedia.org/api/rest_v1/page/summary/{topic.replace(' ', '_')}",
-                    timeout=aiohttp.ClientTimeout(total=10)
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        research += f"📖 Wikipedia Summary:\n{data.get('extract', 'No summary available')}\n\n"
-                    else:
-                        research += "📖 Wikipedia: No information available\n\n"
-        except Exception as e:
-            research += f"📖 Wikipedia: Error accessing data ({str(e)})\n\n"
+            value = await fetch(topic)
+        except Exception:
+            # Degrade to stale research rather than failing while an upstream is down
+            if self.cache is not None:
+                stale = await loop.run_in_executor(None, self.cache.get, source, key, True)
+                if stale is not MISSING:
+                    return stale
+            raise
+
+        # Partial PubMed batches are not worth remembering; an earlier complete one is worth more
+        complete = not (source == "pubmed" and any(a.get("title") is None for a in value))
+        if self.cache is not None:
+            if complete:
+                await loop.run_in_executor(None, self.cache.set, source, key, value)
+            else:
+                stale = await loop.run_in_executor(None, self.cache.get, source, key, True)
+                if stale is not MISSING:
+                    return stale
+        return value
+
+    async def fetch_wikipedia(self, topic: str) -> Optional[str]:
+        """Return the Wikipedia summary extract, or None when no page exists"""
+        response = await self.http.fetch(
+            "GET", f"{WIKIPEDIA_SUMMARY_URL}/{quote(topic.replace(' ', '_'), safe='')}"
+        )
+        if response.status == 404:
+            return None
+        # Any other failure must not be cached as "no page"
+        if response.status != 200:
+            raise UpstreamError(f"Wikipedia returned HTTP {response.status}")
+        return response.json().get('extract', 'No summary available')
+
+    async def fetch_pubmed(self, topic: str) -> List[Dict[str, Any]]:
+        """Search PubMed and fetch every matching article in one batched efetch call"""
+        params = {"db": "pubmed", "term": topic, "retmax": str(self.pubmed_retmax)}
+        if self.ncbi_api_key:
+            params["api_key"] = self.ncbi_api_key
+        response = await self.http.fetch("GET", f"{EUTILS_BASE_URL}/esearch.fcgi", params=params)
+        # Raised rather than returned as [], which would be cached as "no articles"
+        if response.status != 200:
+            raise UpstreamError(f"PubMed esearch returned HTTP {response.status}")
+        root = ET.fromstring(response.text)
+
+        # Extract PMIDs
+        pmids = [pmid.text for pmid in root.findall(".//Id") if pmid.text]
+        if not pmids:
+            return []
+
+        articles: Dict[str, Dict[str, Any]] = {}
+        parsers: List[PubmedArticleParser] = []
+
+        def add_article(article: Dict[str, Any]) -> None:
+            if article["pmid"]:
+                articles[article["pmid"]] = article
+
+        def new_parser() -> Callable[[bytes], None]:
+            # A retried attempt starts from an empty batch
+            articles.clear()
+            parsers.append(PubmedArticleParser(add_article))
+            return parsers[-1].feed
 
-        # PubMed research
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi?db=pubmed&term={topic.replace(' ', '+')}&retmax=3",
-                    timeout=aiohttp.ClientTimeout(total=10)
-                ) as response:
-                    if response.status == 200:
-                        xml_data = await response.text()
-                        root = ET.fromstring(xml_data)
-
-                        # Extract PMIDs
-                        pmids = []
-                        for pmid in root.findall(".//Id"):
-                            pmids.append(pmid.text)
-
-                        if pmids:
-                            research += f"🔬 Key Research Articles ({len(pmids)} found):\n"
-                            for i, pmid in enumerate(pmids[:3], 1):
-                                try:
-                                    async with session.get(
-                                        f"https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi?db=pubmed&id={pmid}&retmode=xml",
-                                        timeout=aiohttp.ClientTimeout(total=10)
-                                    ) as abstract_response:
-                                        if abstract_response.status == 200:
-                                            abstract_xml = await abstract_response.text()
-                                            abstract_root = ET.fromstring(abstract_xml)
-
-                                            # Extract title and abstract
-                                            article = abstract_root.find(".//Article")
-                                            if article is not None:
-                                                title_elem = article.find(".//ArticleTitle")
-                                                abstract_elem = article.find(".//AbstractText")
-
-                                                title = title_elem.text if title_elem is not None else "No title"
-                                                abstract = abstract_elem.text if abstract_elem is not None else "No abstract"
-
-                                                research += f"{i}. {title[:100]}...\n   {abstract[:150]}...\n\n"
-                                except Exception as e:
-                                    research += f"{i}. Article {pmid}: Error retrieving details\n\n"
-                        else:
-                            research += "🔬 No recent research articles found\n\n"
+            params = {"db": "pubmed", "id": ",".join(pmids), "retmode": "xml"}
+            if self.ncbi_api_key:
+                params["api_key"] = self.ncbi_api_key
+            # NCBI asks for POST once the id list gets long; either way records are parsed
+            # out of the body as it arrives instead of after reading it whole
+            if len(pmids) > EFETCH_GET_MAX_IDS:
+                abstract_response = await self.http.fetch("POST", f"{EUTILS_BASE_URL}/efetch.fcgi",
+                                                          stream=new_parser, data=params)
+            else:
+                abstract_response = await self.http.fetch("GET", f"{EUTILS_BASE_URL}/efetch.fcgi",
+                                                          stream=new_parser, params=params)
+            if abstract_response.status != 200:
+                raise UpstreamError(f"PubMed efetch returned HTTP {abstract_response.status}")
+            parsers[-1].close()
         except Exception as e:
-            research += f"🔬 PubMed: Error accessing research database ({str(e)})\n\n"
+            # Articles missing from the batch are reported individually, but say why
+            print(f"PubMed efetch failed for {len(pmids)} articles "
+                  f"({len(articles)} parsed): {type(e).__name__}: {str(e)}", file=sys.stderr)
+
+        return [articles.get(pmid, {"pmid": pmid, "title": None, "abstract": None}) for pmid in pmids]
+
+    @staticmethod
+    def research_warnings(wikipedia: Any, pubmed: Any) -> List[str]:
+        """Describe the research sources that failed, for callers that must not mistake a degraded deck for a good one"""
+        warnings = [f"{source} research failed: {str(result)}"
+                    for source, result in (("Wikipedia", wikipedia), ("PubMed", pubmed))
+                    if isinstance(result, Exception)]
+        if isinstance(pubmed, list):
+            missing = [article["pmid"] for article in pubmed if article.get("title") is None]
+            if missing:
+                warnings.append(f"PubMed details missing for {len(missing)} of {len(pubmed)} articles")
+        return warnings
+
+    def format_research(self, topic: str, wikipedia: Any, pubmed: Any) -> str:
+        """Render fetched research (or the exceptions raised fetching it) as a text summary"""
+        research = f"=== Research Summary for: {topic} ===\n\n"
+
+        # Wikipedia research
+        if isinstance(wikipedia, Exception):
+            research += f"📖 Wikipedia: Error accessing data ({str(wikipedia)})\n\n"
+        elif wikipedia is None:
+            research += "📖 Wikipedia: No information available\n\n"
+        else:
+            research += f"📖 Wikipedia Summary:\n{wikipedia}\n\n"
+
+        # PubMed research
+        if isinstance(pubmed, Exception):
+            research += f"🔬 PubMed: Error accessing research database ({str(pubmed)})\n\n"
+        elif not pubmed:
+            research += "🔬 No recent research articles found\n\n"
+        else:
+            research += f"🔬 Key Research Articles ({len(pubmed)} found):\n"
+            for i, article in enumerate(pubmed, 1):
+                if article.get("title") is None:
+                    research += f"{i}. Article {article['pmid']}: Error retrieving details\n\n"
+                else:
+                    research += f"{i}. {article['title'][:100]}...\n   {article['abstract'][:150]}...\n\n"
 
         return research
 
@@ -291,131 +564,356 @@ The presentation includes comprehensive content based on current research and ev
 
     def create_pptx(self, topic: str, content: List[str], slides: int) -> str:
         """Create PowerPoint presentation"""
-        prs = Presentation()
+        return render_pptx(topic, content, slides)
 
-        # Title slide
-        slide = prs.slides.add_slide(prs.slide_layouts[0])
-        title = slide.shapes.title
-        subtitle = slide.placeholders[1]
-        title.text = topic
-        subtitle.text = "Comprehensive Seminar Presentation"
+    def create_pptx_bytes(self, topic: str, content: List[str], slides: int) -> bytes:
+        """Create PowerPoint presentation and return it as .pptx bytes"""
+        return render_pptx_bytes(topic, content, slides)
 
-        # Learning objectives slide
-        slide = prs.slides.add_slide(prs.slide_layouts[1])
-        shapes = slide.shapes
-        title_shape = shapes.title
-        body_shape = shapes.placeholders[1]
-        title_shape.text = "Learning Objectives"
-        tf = body_shape.text_frame
-        tf.text = content[4] + "\n" + content[5] + "\n" + content[6] + "\n" + content[7]
+    def write_pptx(self, topic: str, content: List[str], slides: int, stream: IO[bytes]) -> None:
+        """Create PowerPoint presentation into a caller-supplied binary stream"""
+        build_presentation(topic, content, slides).save(stream)
 
-        # Outline slide
-        slide = prs.slides.add_slide(prs.slide_layouts[1])
-        shapes = slide.shapes
-        title_shape = shapes.title
-        body_shape = shapes.placeholders[1]
-        title_shape.text = "Presentation Outline"
-        tf = body_shape.text_frame
-        for i in range(8, 15):
-            tf.text += content[i] + "\n"
-
-        # Content slides
-        content_start = 15
-        for i in range(content_start, min(len(content), content_start + slides - 5), 3):
-            slide = prs.slides.add_slide(prs.slide_layouts[1])
-            shapes = slide.shapes
-            title_shape = shapes.title
-            body_shape = shapes.placeholders[1]
-
-            title_shape.text = content[i] if i < len(content) else f"Slide {i+1}"
-            tf = body_shape.text_frame
-
-            for j in range(1, 3):
-                if i + j < len(content):
-                    tf.text += content[i + j] + "\n"
-
-        # Conclusions slide
-        slide = prs.slides.add_slide(prs.slide_layouts[1])
-        shapes = slide.shapes
-        title_shape = shapes.title
-        body_shape = shapes.placeholders[1]
-        title_shape.text = "Conclusions"
-        tf = body_shape.text_frame
-        tf.text = content[-4] + "\n" + content[-3] + "\n" + content[-2]
+    async def generate_pptx_bytes(self, topic: str, slides: int = 20) -> bytes:
+        """Research a topic and return its deck as bytes, for in-process callers such as the web app"""
+        research_data = await self.research_topic(topic)
+        content = self.generate_content(topic, research_data, slides)
+        return await self.run_render(render_pptx_bytes, topic, content, slides)
+
+    def generate_visualizations(self, topic: str, research: str) -> str:
+        """Generate basic visualizations"""
+        try:
+            return render_visualizations(topic)
+        except Exception as e:
+            return f"Visualization generation failed: {str(e)}"
 
-        # Recommendations slide
+    def get_render_pool(self) -> Optional[ProcessPoolExecutor]:
+        """Return the render process pool, starting warm workers on first use"""
+        if self._render_pool is None and self.render_workers > 0:
+            # spawn rather than fork: the server process already runs reader threads
+            self._render_pool = ProcessPoolExecutor(
+                max_workers=self.render_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_warm_render_worker
+            )
+            for _ in range(self.render_workers):
+                self._render_pool.submit(_noop)
+        return self._render_pool
+
+    async def run_render(self, func, *args) -> Any:
+        """Run a CPU-bound rendering stage off the event loop, once more on a fresh pool if a worker died"""
+        pool = self.get_render_pool()
+        try:
+            return await asyncio.get_event_loop().run_in_executor(pool, func, *args)
+        except BrokenProcessPool:
+            # A dead worker (out of memory, a crash in a native library) breaks the whole pool for good
+            print("Render pool broken; restarting its workers", file=sys.stderr)
+            self._discard_render_pool(pool)
+        return await asyncio.get_event_loop().run_in_executor(self.get_render_pool(), func, *args)
+
+    def _discard_render_pool(self, pool: ProcessPoolExecutor) -> None:
+        # Concurrent renders fail together; only the first replaces the pool
+        if self._render_pool is pool:
+            self._render_pool = None
+            pool.shutdown(wait=False)
+
+    def start_warm_up(self) -> None:
+        """Load what the first tool call needs in the background (once, unless SEMINAR_WARMUP=0)"""
+        if self.warm_up_enabled and self._warm_up is None:
+            self._warm_up = asyncio.ensure_future(self.warm_up())
+
+    async def warm_up(self) -> None:
+        """Start the render workers and import the HTTP client, plus the rendering stack when rendering in-process"""
+        loop = asyncio.get_event_loop()
+        pool = self.get_render_pool()
+        await loop.run_in_executor(None, warm_imports, HTTP_MODULES)
+        if pool is None:
+            await loop.run_in_executor(None, _warm_render_worker)
+
+
+def build_presentation(topic: str, content: List[str], slides: int):
+    """Build the seminar Presentation in memory"""
+    from template_pool import default_pool
+    from text_fit import body_metrics, shrink_text_frame
+    from text_frames import fill_text_frame
+
+    prs = default_pool.acquire()
+    # The slide count is fixed by the request, so overflowing bullets are shrunk rather than split
+    metrics = body_metrics(prs.slide_layouts[1])
+
+    # Title slide
+    slide = prs.slides.add_slide(prs.slide_layouts[0])
+    title = slide.shapes.title
+    subtitle = slide.placeholders[1]
+    title.text = topic
+    subtitle.text = "Comprehensive Seminar Presentation"
+
+    # Learning objectives slide
+    slide = prs.slides.add_slide(prs.slide_layouts[1])
+    shapes = slide.shapes
+    title_shape = shapes.title
+    body_shape = shapes.placeholders[1]
+    title_shape.text = "Learning Objectives"
+    fill_text_frame(body_shape.text_frame, content[4:8])
+    shrink_text_frame(body_shape, content[4:8], metrics)
+
+    # Outline slide
+    slide = prs.slides.add_slide(prs.slide_layouts[1])
+    shapes = slide.shapes
+    title_shape = shapes.title
+    body_shape = shapes.placeholders[1]
+    title_shape.text = "Presentation Outline"
+    # One paragraph per line, keeping the trailing empty paragraph this slide has always ended with
+    fill_text_frame(body_shape.text_frame, content[8:15] + [""])
+    shrink_text_frame(body_shape, content[8:15] + [""], metrics)
+
+    # Content slides
+    content_start = 15
+    for i in range(content_start, min(len(content), content_start + slides - 5), 3):
         slide = prs.slides.add_slide(prs.slide_layouts[1])
         shapes = slide.shapes
         title_shape = shapes.title
         body_shape = shapes.placeholders[1]
-        title_shape.text = "Recommendations"
-        tf = body_shape.text_frame
-        tf.text = content[-1]
-
-        # Save presentation
-        filename = f"seminar_{topic.replace(' ', '_').replace('/', '_')}.pptx"
-        prs.save(filename)
-        return filename
 
-    def generate_visualizations(self, topic: str, research: str) -> str:
-        """Generate basic visualizations"""
+        title_shape.text = content[i] if i < len(content) else f"Slide {i+1}"
+        fill_text_frame(body_shape.text_frame, content[i + 1:i + 3] + [""])
+        shrink_text_frame(body_shape, content[i + 1:i + 3] + [""], metrics)
+
+    # Conclusions slide
+    slide = prs.slides.add_slide(prs.slide_layouts[1])
+    shapes = slide.shapes
+    title_shape = shapes.title
+    body_shape = shapes.placeholders[1]
+    title_shape.text = "Conclusions"
+    fill_text_frame(body_shape.text_frame, content[-4:-1])
+    shrink_text_frame(body_shape, content[-4:-1], metrics)
+
+    # Recommendations slide
+    slide = prs.slides.add_slide(prs.slide_layouts[1])
+    shapes = slide.shapes
+    title_shape = shapes.title
+    body_shape = shapes.placeholders[1]
+    title_shape.text = "Recommendations"
+    fill_text_frame(body_shape.text_frame, content[-1:])
+    shrink_text_frame(body_shape, content[-1:], metrics)
+    return prs
+
+
+def render_pptx(topic: str, content: List[str], slides: int) -> str:
+    """Create PowerPoint presentation (runs inside a render worker)"""
+    from pptx_streaming import atomic_write
+
+    filename = f"seminar_{topic.replace(' ', '_').replace('/', '_')}.pptx"
+    # Concurrent requests for one topic each write a complete file instead of interleaving
+    atomic_write(filename, build_presentation(topic, content, slides).save)
+    return filename
+
+
+def render_pptx_bytes(topic: str, content: List[str], slides: int) -> bytes:
+    """Create PowerPoint presentation as .pptx bytes (runs inside a render worker)"""
+    buffer = io.BytesIO()
+    build_presentation(topic, content, slides).save(buffer)
+    return buffer.getvalue()
+
+
+def render_visualizations(topic: str) -> str:
+    """Generate basic visualizations (runs inside a render worker); failures raise"""
+    from charts import ChartSpec, save_chart
+
+    # Sample data for medical presentation
+    spec = ChartSpec(
+        type='column_clustered',
+        categories=('Pre-Intervention', 'Post-Intervention', 'Control Group'),
+        series=(('Improvement Score', (65, 85, 70)),),
+        title=f'{topic} - Outcome Comparison',
+        y_label='Improvement Score',
+        colors=('#ff6b6b', '#4ecdc4', '#45b7d1'),
+        y_limits=(0, 100),
+        size=(10, 6),
+        dpi=300,
+        tight=True
+    )
+
+    # Save chart; repeated topics are served from the chart render cache
+    chart_filename = f"visualization_{topic.replace(' ', '_').replace('/', '_')}.png"
+    save_chart(spec, chart_filename)
+
+    return chart_filename
+
+
+def _warm_render_worker() -> None:
+    """Import the rendering stack once so that the first job in a worker is not cold"""
+    warm_imports(RENDER_MODULES + CHART_MODULES)
+    from template_pool import default_pool
+    default_pool.prefill(count=2)
+
+
+def warm_imports(modules) -> Dict[str, int]:
+    """Import modules that are otherwise loaded on first use; returns the milliseconds each took"""
+    timings = {}
+    for name in modules:
+        started = time.perf_counter()
+        importlib.import_module(name)
+        timings[name] = int((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def _noop() -> None:
+    """Used to force the pool to start its workers ahead of the first request"""
+
+
+class RequestDispatcher:
+    """Run each JSON-RPC request as its own task and write responses as they complete"""
+
+    def __init__(self, server: SeminarGeneratorServer, max_concurrency: int = DEFAULT_MAX_CONCURRENCY):
+        self.server = server
+        # Only tool calls are bounded; protocol methods such as initialize and
+        # tools/list never queue behind a long-running generation.
+        self.semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        self.write_lock = asyncio.Lock()
+        self.pending: set = set()
+
+    def dispatch(self, request: Dict[str, Any]) -> None:
+        """Schedule a request without waiting for it to finish"""
+        task = asyncio.ensure_future(self._run(request))
+        self.pending.add(task)
+        task.add_done_callback(self.pending.discard)
+
+    async def _run(self, request: Dict[str, Any]) -> None:
         try:
-            # Create a simple chart
-            fig, ax = plt.subplots(figsize=(10, 6))
-
-            # Sample data for medical presentation
-            categories = ['Pre-Intervention', 'Post-Intervention', 'Control Group']
-            values = [65, 85, 70]
+            if request.get("method") == "tools/call":
+                async with self.semaphore:
+                    response = await self.server.handle_request(request)
+            else:
+                response = await self.server.handle_request(request)
+        except Exception as e:
+            response = {
+                "jsonrpc": "2.0",
+                "id": request.get("id"),
+                "error": {
+                    "code": -32603,
+                    "message": f"Internal error: {str(e)}"
+                }
+            }
 
-            ax.bar(categories, values, color=['#ff6b6b', '#4ecdc4', '#45b7d1'])
-            ax.set_title(f'{topic} - Outcome Comparison')
-            ax.set_ylabel('Improvement Score')
-            ax.set_ylim(0, 100)
+        # Notifications carry no id and must not be answered
+        if "id" in request:
+            await self.write(response)
+        # Only once the handshake is answered, so that it never waits on the warm-up
+        if request.get("method") == "initialize":
+            self.server.start_warm_up()
 
-            # Save chart
-            chart_filename = f"visualization_{topic.replace(' ', '_').replace('/', '_')}.png"
-            plt.savefig(chart_filename, dpi=300, bbox_inches='tight')
-            plt.close()
+    async def write(self, message: Dict[str, Any]) -> None:
+        """Write one JSON-RPC message per line, never interleaving concurrent writers"""
+        line = json.dumps(message)
+        async with self.write_lock:
+            await asyncio.get_event_loop().run_in_executor(
+                None,
+                lambda: print(line, flush=True)
+            )
 
-            return chart_filename
+    async def drain(self) -> None:
+        """Wait for every in-flight request to be answered"""
+        if self.pending:
+            await asyncio.gather(*list(self.pending), return_exceptions=True)
 
-        except Exception as e:
-            return f"Visualization generation failed: {str(e)}"
 
 async def main():
     """Main server loop"""
     server = SeminarGeneratorServer()
+    max_concurrency = int(os.environ.get("SEMINAR_MAX_CONCURRENCY", DEFAULT_MAX_CONCURRENCY))
+    dispatcher = RequestDispatcher(server, max_concurrency)
+    server.notify = dispatcher.write
 
     try:
-        # Read from stdin
+        # Read from stdin; responses are written out of order and matched by id
         while True:
-            try:
-                line = await asyncio.get_event_loop().run_in_executor(None, sys.stdin.readline)
-                if not line:
-                    break
+            line = await asyncio.get_event_loop().run_in_executor(None, sys.stdin.readline)
+            if not line:
+                break
+            if not line.strip():
+                continue
 
+            try:
                 request = json.loads(line.strip())
-                response = await server.handle_request(request)
-
-                # Write to stdout
-                await asyncio.get_event_loop().run_in_executor(
-                    None,
-                    lambda: print(json.dumps(response), flush=True)
-                )
-
             except json.JSONDecodeError:
                 # Handle invalid JSON
-                error_response = {
+                await dispatcher.write({
                     "jsonrpc": "2.0",
+                    "id": None,
                     "error": {
                         "code": -32700,
                         "message": "Parse error"
                     }
-                }
-                print(json.dumps(error_response), flush=True)
+                })
+                continue
+
+            if not isinstance(request, dict):
+                await dispatcher.write({
+                    "jsonrpc": "2.0",
+                    "id": None,
+                    "error": {
+                        "code": -32600,
+                        "message": "Invalid Request"
+                    }
+                })
+                continue
+
+            dispatcher.dispatch(request)
+
+        await dispatcher.drain()
 
     except KeyboardInterrupt:
         print("Server shutting down...", file=sys.stderr)
 
+    finally:
+        await server.close()
+
+def _module_import_times() -> Dict[str, int]:
+    """Cumulative import time in microseconds of every module loaded by `import mcp_server`, in a fresh interpreter"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import mcp_server"],
+        cwd=os.path.dirname(os.path.abspath(__file__)), capture_output=True, text=True, check=True
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        fields = line.split("|")
+        if line.startswith("import time:") and fields[1].strip().isdigit():
+            times[fields[2].strip()] = int(fields[1])
+    return times
+
+
+async def _handshake_ms() -> float:
+    started = time.perf_counter()
+    async with SeminarGeneratorServer() as server:
+        await server.handle_request({"jsonrpc": "2.0", "id": 1, "method": "initialize", "params": {}})
+        await server.handle_request({"jsonrpc": "2.0", "id": 2, "method": "tools/list"})
+    return (time.perf_counter() - started) * 1000
+
+
+def report_import_times() -> int:
+    """Print the startup cost and what each group of lazy imports costs on first use; non-zero when over budget"""
+    budget = float(os.environ.get("SEMINAR_STARTUP_BUDGET_MS", STARTUP_BUDGET_MS))
+    times = _module_import_times()
+    import_ms = times.get("mcp_server", 0) / 1000
+    heavy = [name for name in HEAVY_PACKAGES if name in times]
+    handshake_ms = asyncio.run(_handshake_ms())
+    startup_ms = import_ms + handshake_ms
+
+    print(f"import mcp_server: {import_ms:.1f} ms", file=sys.stderr)
+    print(f"initialize + tools/list: {handshake_ms:.1f} ms", file=sys.stderr)
+    print(f"heavy packages loaded at startup: {', '.join(heavy) or 'none'}", file=sys.stderr)
+    for label, modules in (("http", HTTP_MODULES), ("render", RENDER_MODULES), ("charts", CHART_MODULES)):
+        timings = warm_imports(modules)
+        print(f"first use, {label}: {sum(timings.values())} ms "
+              f"({', '.join(f'{name} {ms}' for name, ms in timings.items())})", file=sys.stderr)
+
+    status = "within" if startup_ms <= budget else "over"
+    print(f"startup {startup_ms:.1f} ms, {status} the {budget:.0f} ms budget", file=sys.stderr)
+    return 0 if startup_ms <= budget else 1
+
+
 if __name__ == "__main__":
+    if "--import-times" in sys.argv[1:]:
+        sys.exit(report_import_times())
     asyncio.run(main())
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Incremental parser for PubMed efetch XML
+Yields one structured record per PubmedArticle and discards each element
+once it has been read, so memory stays flat regardless of batch size.
+PubmedArticleParser takes the body chunk by chunk as it arrives from the
+network, so the whole response is never held either
+"""
+
+import xml.etree.ElementTree as ET
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
+
+CHUNK_SIZE = 64 * 1024
+
+Source = Union[str, bytes, Iterable[Union[str, bytes]]]
+
+
+def _text(elem: Optional[ET.Element]) -> Optional[str]:
+    """Return all text inside an element, including inline markup such as <i> and <sup>"""
+    if elem is None:
+        return None
+    text = "".join(elem.itertext()).strip()
+    return text or None
+
+
+def _chunks(source: Source) -> Iterator[Union[str, bytes]]:
+    if isinstance(source, (str, bytes)):
+        for start in range(0, len(source), CHUNK_SIZE):
+            yield source[start:start + CHUNK_SIZE]
+    elif hasattr(source, "read"):
+        while True:
+            chunk = source.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            yield chunk
+    else:
+        yield from source
+
+
+def parse_article(record: ET.Element) -> Dict[str, Any]:
+    """Extract PMID, title, abstract sections, journal, year and DOI from one PubmedArticle"""
+    citation = record.find("MedlineCitation")
+    article = citation.find("Article") if citation is not None else None
+
+    sections: List[Dict[str, Optional[str]]] = []
+    title = journal = year = doi = None
+    if article is not None:
+        title = _text(article.find("ArticleTitle"))
+        for abstract_text in article.iterfind("Abstract/AbstractText"):
+            text = _text(abstract_text)
+            if text:
+                sections.append({"label": abstract_text.get("Label"), "text": text})
+
+        journal_elem = article.find("Journal")
+        if journal_elem is not None:
+            journal = _text(journal_elem.find("Title")) or _text(journal_elem.find("ISOAbbreviation"))
+            pub_date = journal_elem.find("JournalIssue/PubDate")
+            if pub_date is not None:
+                year = _text(pub_date.find("Year"))
+                if year is None:
+                    medline_date = _text(pub_date.find("MedlineDate"))
+                    year = medline_date[:4] if medline_date else None
+
+        for location in article.iterfind("ELocationID"):
+            if location.get("EIdType") == "doi":
+                doi = _text(location)
+                break
+
+    if doi is None:
+        for article_id in record.iterfind("PubmedData/ArticleIdList/ArticleId"):
+            if article_id.get("IdType") == "doi":
+                doi = _text(article_id)
+                break
+
+    return {
+        "pmid": _text(citation.find("PMID")) if citation is not None else None,
+        "title": title or "No title",
+        "abstract_sections": sections,
+        "abstract": " ".join(section["text"] for section in sections) or "No abstract",
+        "journal": journal,
+        "year": year,
+        "doi": doi
+    }
+
+
+class PubmedArticleParser:
+    """Push parser for efetch XML: feed() it chunks and each finished article is passed to on_article"""
+
+    def __init__(self, on_article: Callable[[Dict[str, Any]], None]):
+        self.on_article = on_article
+        self._parser = ET.XMLPullParser(events=("start", "end"))
+        self._root: Optional[ET.Element] = None
+        self._error: Optional[Exception] = None
+
+    def feed(self, chunk: Union[str, bytes]) -> None:
+        # Parse errors are reported by close(), so a bad body is not mistaken for a failed download
+        if self._error is not None:
+            return
+        try:
+            self._parser.feed(chunk)
+            self._read_events()
+        except Exception as e:
+            self._error = e
+
+    def close(self) -> None:
+        """Finish the document; raises the first parse error, e.g. ET.ParseError for truncated XML"""
+        if self._error is not None:
+            raise self._error
+        self._parser.close()
+        self._read_events()
+
+    def _read_events(self) -> None:
+        for event, elem in self._parser.read_events():
+            if event == "start":
+                if self._root is None:
+                    self._root = elem
+                continue
+            if elem.tag == "PubmedArticle":
+                self.on_article(parse_article(elem))
+                # Drop the finished record so the tree never grows with the batch
+                elem.clear()
+                if self._root is not None:
+                    self._root.clear()
+
+
+def iter_pubmed_articles(source: Source) -> Iterator[Dict[str, Any]]:
+    """Yield article records from efetch XML given as text, bytes, a file or an iterable of chunks"""
+    ready: List[Dict[str, Any]] = []
+    parser = PubmedArticleParser(ready.append)
+    for chunk in _chunks(source):
+        parser.feed(chunk)
+        yield from ready
+        ready.clear()
+    parser.close()
+    yield from ready
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Persistent research cache for the PG Seminar MCP server
+Stores Wikipedia extracts and parsed PubMed records in SQLite with
+per-source TTLs and least-recently-used eviction under a byte budget
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "seminar-generator")
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_TTLS = {
+    "wikipedia": 30 * 24 * 3600,
+    "pubmed": 7 * 24 * 3600,
+}
+
+# Returned by get() on a miss, since None is a valid cached value
+MISSING = object()
+
+
+def normalize_topic(topic: str) -> str:
+    """Normalize a topic so that trivially different spellings share a cache entry"""
+    return " ".join(topic.lower().split())
+
+
+class ResearchCache:
+    """SQLite-backed key/value cache keyed by (source, normalized topic)"""
+
+    def __init__(self, directory: Optional[str] = None, ttls: Optional[Dict[str, float]] = None,
+                 max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = directory or DEFAULT_CACHE_DIR
+        self.ttls = dict(DEFAULT_TTLS, **(ttls or {}))
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+        os.makedirs(self.directory, exist_ok=True)
+        self.path = os.path.join(self.directory, "research_cache.sqlite3")
+        # Several batch workers may share the file, so use WAL and wait on locks
+        self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS entries (
+                source TEXT NOT NULL,
+                key TEXT NOT NULL,
+                value TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created REAL NOT NULL,
+                accessed REAL NOT NULL,
+                PRIMARY KEY (source, key)
+            )"""
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)")
+        self._conn.commit()
+
+    @classmethod
+    def from_env(cls) -> "ResearchCache":
+        """Build a cache from SEMINAR_CACHE_DIR and SEMINAR_CACHE_MAX_BYTES"""
+        return cls(
+            directory=os.environ.get("SEMINAR_CACHE_DIR") or None,
+            max_bytes=int(os.environ.get("SEMINAR_CACHE_MAX_BYTES", DEFAULT_MAX_BYTES))
+        )
+
+    def get(self, source: str, key: str, allow_stale: bool = False) -> Any:
+        """Return the cached value, or MISSING if absent or older than the source TTL"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created FROM entries WHERE source = ? AND key = ?",
+                (source, key)
+            ).fetchone()
+            if row is None:
+                return MISSING
+
+            value, created = row
+            now = time.time()
+            if not allow_stale and now - created > self.ttls.get(source, 0):
+                return MISSING
+
+            self._conn.execute(
+                "UPDATE entries SET accessed = ? WHERE source = ? AND key = ?",
+                (now, source, key)
+            )
+            self._conn.commit()
+        return json.loads(value)
+
+    def set(self, source: str, key: str, value: Any) -> None:
+        """Store a JSON-serializable value and evict old entries beyond the byte budget"""
+        payload = json.dumps(value)
+        size = len(payload.encode("utf-8")) + len(key) + len(source)
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (source, key, value, size, created, accessed) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (source, key, payload, size, now, now)
+            )
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self) -> None:
+        """Delete least recently used entries until the cache fits in max_bytes"""
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        victims = []
+        for source, key, size in self._conn.execute(
+            "SELECT source, key, size FROM entries ORDER BY accessed ASC"
+        ):
+            if total <= self.max_bytes:
+                break
+            victims.append((source, key))
+            total -= size
+        self._conn.executemany("DELETE FROM entries WHERE source = ? AND key = ?", victims)
+
+    def close(self) -> None:
+        """Close the underlying database connection"""
+        with self._lock:
+            self._conn.close()
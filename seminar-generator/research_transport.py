@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Pluggable HTTP transports for research requests made by the PG Seminar MCP server
+live:   talk to Wikipedia and NCBI directly over a pooled aiohttp session
+record: like live, but also save every response as a fixture file
+replay: serve recorded fixtures from the local stand-in server (standin_server.py)
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+from resilience import HttpResult
+
+if TYPE_CHECKING:
+    import aiohttp
+
+HTTP_TIMEOUT_SECONDS = 10
+HTTP_CONNECTION_LIMIT = 32
+HTTP_LIMIT_PER_HOST = 8
+HTTP_KEEPALIVE_SECONDS = 60
+DNS_CACHE_TTL_SECONDS = 300
+STREAM_CHUNK_SIZE = 64 * 1024
+
+DEFAULT_FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+# Never written to fixtures or used to match them
+SECRET_PARAMS = {"api_key"}
+RECORDED_HEADERS = ("Content-Type", "Retry-After")
+
+
+def fixture_key(method: str, host: str, path: str, query: Iterable[Tuple[str, str]],
+                form: Iterable[Tuple[str, str]] = ()) -> str:
+    """Identify a request independently of parameter order, quoting and secrets"""
+    canonical = json.dumps([
+        method.upper(),
+        host.lower(),
+        unquote(path),
+        sorted((k, v) for k, v in query if k not in SECRET_PARAMS),
+        sorted((k, v) for k, v in form if k not in SECRET_PARAMS)
+    ])
+    return hashlib.sha1(canonical.encode("utf-8")).hexdigest()[:20]
+
+
+def fixture_path(fixtures_dir: str, host: str, key: str) -> str:
+    return os.path.join(fixtures_dir, host.lower(), f"{key}.json")
+
+
+def request_key(method: str, url: str, params: Optional[Dict[str, str]] = None,
+                data: Optional[Dict[str, str]] = None) -> Tuple[str, str]:
+    """Return (host, fixture key) for a request as issued by the server"""
+    parts = urlsplit(url)
+    query = parse_qsl(parts.query) + list((params or {}).items())
+    return parts.netloc, fixture_key(method, parts.netloc, parts.path, query, list((data or {}).items()))
+
+
+class LiveTransport:
+    """Send requests over one pooled, keep-alive aiohttp session"""
+
+    caches_research = True
+
+    def __init__(self, limit_per_host: int = HTTP_LIMIT_PER_HOST):
+        self.limit_per_host = limit_per_host
+        self._session: Optional["aiohttp.ClientSession"] = None
+
+    async def get_session(self) -> "aiohttp.ClientSession":
+        """Return the shared HTTP session, creating it on first use"""
+        if self._session is None or self._session.closed:
+            # Imported here so that the MCP handshake does not wait for aiohttp
+            import aiohttp
+
+            connector = aiohttp.TCPConnector(
+                limit=HTTP_CONNECTION_LIMIT,
+                limit_per_host=self.limit_per_host,
+                ttl_dns_cache=DNS_CACHE_TTL_SECONDS,
+                keepalive_timeout=HTTP_KEEPALIVE_SECONDS
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=HTTP_TIMEOUT_SECONDS)
+            )
+        return self._session
+
+    async def send(self, method: str, url: str, sink: Optional[Callable[[bytes], None]] = None,
+                   **kwargs) -> HttpResult:
+        """Perform one HTTP request and read the whole body, or pass a 200 body to `sink` chunk by chunk"""
+        session = await self.get_session()
+        async with session.request(method, url, **kwargs) as response:
+            if sink is not None and response.status == 200:
+                async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE):
+                    sink(chunk)
+                return HttpResult(response.status, "", dict(response.headers))
+            return HttpResult(response.status, await response.text(), dict(response.headers))
+
+    async def close(self) -> None:
+        """Release pooled connections"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+
+class RecordingTransport:
+    """Forward requests to another transport and save each response as a fixture"""
+
+    # Cached research would never reach the network, so nothing would be recorded
+    caches_research = False
+
+    def __init__(self, inner: Any, fixtures_dir: str = DEFAULT_FIXTURES_DIR):
+        self.inner = inner
+        self.fixtures_dir = fixtures_dir
+
+    async def send(self, method: str, url: str, sink: Optional[Callable[[bytes], None]] = None,
+                   **kwargs) -> HttpResult:
+        chunks: List[bytes] = []
+
+        def tee(chunk: bytes) -> None:
+            chunks.append(chunk)
+            sink(chunk)
+
+        result = await self.inner.send(method, url, sink=tee if sink is not None else None, **kwargs)
+        host, key = request_key(method, url, kwargs.get("params"), kwargs.get("data"))
+        fixture = {
+            "request": {"method": method.upper(), "url": url.split("?")[0]},
+            "status": result.status,
+            "headers": {h: result.headers[h] for h in RECORDED_HEADERS if h in result.headers},
+            # A streamed body was handed to the sink rather than kept in the result
+            "body": b"".join(chunks).decode("utf-8") if chunks else result.text
+        }
+        await asyncio.get_event_loop().run_in_executor(
+            None, self._write, fixture_path(self.fixtures_dir, host, key), fixture
+        )
+        return result
+
+    @staticmethod
+    def _write(path: str, fixture: Dict[str, Any]) -> None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(fixture, f, ensure_ascii=False, indent=1)
+
+    async def close(self) -> None:
+        await self.inner.close()
+
+
+class ReplayTransport:
+    """Route requests to the local stand-in server, starting one in-process if no URL is given"""
+
+    # Research must come from the stand-in, with its latency and errors, and its 404s for
+    # missing fixtures must not end up in the cache that live runs read
+    caches_research = False
+
+    def __init__(self, fixtures_dir: str = DEFAULT_FIXTURES_DIR, standin_url: Optional[str] = None,
+                 latency_ms: float = 0.0, error_rate: float = 0.0, seed: Optional[int] = None):
+        self.fixtures_dir = fixtures_dir
+        self.standin_url = standin_url.rstrip("/") if standin_url else None
+        self.latency_ms = latency_ms
+        self.error_rate = error_rate
+        self.seed = seed
+        self.live = LiveTransport()
+        self._runner = None
+        self._start_lock: Optional[asyncio.Lock] = None
+
+    async def _base_url(self) -> str:
+        if self.standin_url is None:
+            if self._start_lock is None:
+                self._start_lock = asyncio.Lock()
+            async with self._start_lock:
+                if self.standin_url is None:
+                    from standin_server import start_standin
+                    self._runner, self.standin_url = await start_standin(
+                        self.fixtures_dir, latency_ms=self.latency_ms,
+                        error_rate=self.error_rate, seed=self.seed
+                    )
+        return self.standin_url
+
+    async def send(self, method: str, url: str, sink: Optional[Callable[[bytes], None]] = None,
+                   **kwargs) -> HttpResult:
+        # https://host/path?query  ->  http://stand-in/host/path?query
+        parts = urlsplit(url)
+        local_url = f"{await self._base_url()}/{parts.netloc}{parts.path}"
+        if parts.query:
+            local_url += f"?{parts.query}"
+        return await self.live.send(method, local_url, sink=sink, **kwargs)
+
+    async def close(self) -> None:
+        await self.live.close()
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+
+def create_transport(mode: Optional[str] = None) -> Any:
+    """Build the transport selected by SEMINAR_TRANSPORT (live, record or replay)"""
+    mode = (mode or os.environ.get("SEMINAR_TRANSPORT", "live")).lower()
+    fixtures_dir = os.environ.get("SEMINAR_FIXTURES_DIR") or DEFAULT_FIXTURES_DIR
+    limit_per_host = int(os.environ.get("SEMINAR_HTTP_LIMIT_PER_HOST", HTTP_LIMIT_PER_HOST))
+
+    if mode == "live":
+        return LiveTransport(limit_per_host)
+    if mode == "record":
+        return RecordingTransport(LiveTransport(limit_per_host), fixtures_dir)
+    if mode == "replay":
+        seed = os.environ.get("SEMINAR_STANDIN_SEED")
+        return ReplayTransport(
+            fixtures_dir,
+            standin_url=os.environ.get("SEMINAR_STANDIN_URL") or None,
+            latency_ms=float(os.environ.get("SEMINAR_STANDIN_LATENCY_MS", 0)),
+            error_rate=float(os.environ.get("SEMINAR_STANDIN_ERROR_RATE", 0)),
+            seed=int(seed) if seed else None
+        )
+    raise ValueError(f"Unknown transport mode: {mode}")
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Resilience helpers for research requests made by the PG Seminar MCP server
+Provides per-host token-bucket rate limiting, jittered exponential retry
+and a circuit breaker that fails fast while an upstream is down
+"""
+
+import asyncio
+import json
+import random
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending a request while a host's circuit is open"""
+
+
+class UpstreamError(Exception):
+    """Raised when a host keeps answering 429/5xx after every retry"""
+
+
+class HttpResult:
+    """Status, headers and decoded body of a completed HTTP request"""
+
+    def __init__(self, status: int, text: str, headers: Optional[Dict[str, str]] = None):
+        self.status = status
+        self.text = text
+        self.headers = headers or {}
+
+    def json(self) -> Any:
+        return json.loads(self.text)
+
+
+class TokenBucket:
+    """Async token bucket allowing `rate` requests per second with bursts up to `capacity`"""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class CircuitBreaker:
+    """Open after consecutive failures, then allow one trial request once reset_timeout has passed"""
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return "half-open"
+        return "open"
+
+    def before_request(self, host: str) -> bool:
+        """Raise CircuitOpenError unless a request to the host may be attempted; True for the half-open trial"""
+        state = self.state
+        if state == "open" or (state == "half-open" and self._trial_in_flight):
+            remaining = max(0.0, self.reset_timeout - (time.monotonic() - self.opened_at))
+            raise CircuitOpenError(f"{host} is unavailable, retrying in {remaining:.0f}s")
+        if state == "half-open":
+            self._trial_in_flight = True
+            return True
+        return False
+
+    def abandon_trial(self) -> None:
+        """Let another request be the trial when this one ended without an outcome (e.g. it was cancelled)"""
+        self._trial_in_flight = False
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self._trial_in_flight = False
+        if self.opened_at is not None or self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+
+
+SendFunc = Callable[..., Awaitable[HttpResult]]
+
+
+class ResilientFetcher:
+    """Send HTTP requests through per-host rate limits, retries and circuit breakers"""
+
+    def __init__(self, send: SendFunc, host_rates: Optional[Dict[str, float]] = None,
+                 default_rate: float = 10.0, retries: int = 3, base_delay: float = 0.5,
+                 max_delay: float = 8.0, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.send = send
+        self.host_rates = host_rates or {}
+        self.default_rate = default_rate
+        self.retries = retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._hosts: Dict[str, Tuple[TokenBucket, CircuitBreaker]] = {}
+
+    def _policy(self, host: str) -> Tuple[TokenBucket, CircuitBreaker]:
+        if host not in self._hosts:
+            self._hosts[host] = (
+                TokenBucket(self.host_rates.get(host, self.default_rate)),
+                CircuitBreaker(self.failure_threshold, self.reset_timeout)
+            )
+        return self._hosts[host]
+
+    def _backoff(self, attempt: int, retry_after: Optional[str]) -> float:
+        """Full-jitter exponential backoff, honouring a numeric Retry-After header"""
+        if retry_after is not None:
+            try:
+                return min(self.max_delay, float(retry_after))
+            except ValueError:
+                pass
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+    async def fetch(self, method: str, url: str, stream: Optional[Callable[[], Callable[[bytes], None]]] = None,
+                    **kwargs) -> HttpResult:
+        """Send a request, retrying 429/5xx responses and transport errors until retries run out
+
+        With `stream`, a 200 body is passed chunk by chunk to a sink that stream() creates afresh for
+        every attempt, so a retry after a failure mid-body starts over.
+        """
+        host = urlsplit(url).netloc
+        limiter, breaker = self._policy(host)
+        trial = breaker.before_request(host)
+        try:
+            return await self._send(host, limiter, breaker, method, url, stream, **kwargs)
+        finally:
+            # CancelledError is not an Exception, so a cancelled trial records neither outcome
+            if trial:
+                breaker.abandon_trial()
+
+    async def _send(self, host: str, limiter: TokenBucket, breaker: CircuitBreaker,
+                    method: str, url: str, stream, **kwargs) -> HttpResult:
+        for attempt in range(self.retries + 1):
+            await limiter.acquire()
+            try:
+                if stream is not None:
+                    kwargs["sink"] = stream()
+                result = await self.send(method, url, **kwargs)
+            except Exception as e:
+                # Timeouts, connection resets and aiohttp client errors are all retried
+                error, result = e, None
+            else:
+                if result.status not in RETRY_STATUSES:
+                    breaker.record_success()
+                    return result
+                error = None
+
+            if attempt == self.retries:
+                break
+            retry_after = result.headers.get("Retry-After") if result is not None else None
+            await asyncio.sleep(self._backoff(attempt, retry_after))
+
+        breaker.record_failure()
+        if error is not None:
+            raise error
+        raise UpstreamError(f"{host} returned HTTP {result.status}")
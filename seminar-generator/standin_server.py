@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for Wikipedia and NCBI E-utilities
+Serves fixtures recorded with SEMINAR_TRANSPORT=record, optionally adding
+latency and injected errors, so the research pipeline can be benchmarked
+and load-tested deterministically without network access
+
+Usage: python standin_server.py [--fixtures DIR] [--port 8765] [--latency-ms 50] [--error-rate 0.1] [--seed 1]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+from typing import Optional, Tuple
+
+from aiohttp import web
+
+from research_transport import DEFAULT_FIXTURES_DIR, fixture_key, fixture_path
+
+ERROR_STATUSES = (429, 500, 503)
+
+
+def create_app(fixtures_dir: str = DEFAULT_FIXTURES_DIR, latency_ms: float = 0.0,
+               latency_jitter_ms: float = 0.0, error_rate: float = 0.0,
+               seed: Optional[int] = None) -> web.Application:
+    """Build the stand-in application; requests are addressed as /<upstream host>/<path>"""
+    rng = random.Random(seed)
+    fixtures = {}
+
+    def load(path: str):
+        if path not in fixtures:
+            if not os.path.exists(path):
+                return None
+            with open(path, encoding="utf-8") as f:
+                fixtures[path] = json.load(f)
+        return fixtures[path]
+
+    async def handle(request: web.Request) -> web.Response:
+        host = request.match_info["host"]
+        path = "/" + request.match_info["path"]
+        form = list((await request.post()).items()) if request.method == "POST" else []
+
+        delay = latency_ms + rng.uniform(-latency_jitter_ms, latency_jitter_ms)
+        if delay > 0:
+            await asyncio.sleep(delay / 1000)
+        if error_rate and rng.random() < error_rate:
+            return web.Response(status=rng.choice(ERROR_STATUSES), text="Injected error")
+
+        key = fixture_key(request.method, host, path, request.query.items(), form)
+        fixture = load(fixture_path(fixtures_dir, host, key))
+        if fixture is None:
+            return web.Response(status=404, text=f"No fixture for {request.method} {host}{path} ({key})")
+
+        headers = dict(fixture.get("headers", {}))
+        content_type = headers.pop("Content-Type", "text/plain").split(";")[0]
+        return web.Response(
+            status=fixture["status"], text=fixture["body"],
+            content_type=content_type, headers=headers
+        )
+
+    app = web.Application()
+    app.router.add_route("*", "/{host}/{path:.*}", handle)
+    return app
+
+
+async def start_standin(fixtures_dir: str = DEFAULT_FIXTURES_DIR, host: str = "127.0.0.1",
+                        port: int = 0, **options) -> Tuple[web.AppRunner, str]:
+    """Start the stand-in on the running loop and return (runner, base URL)"""
+    runner = web.AppRunner(create_app(fixtures_dir, **options))
+    await runner.setup()
+    site = web.TCPSite(runner, host, port)
+    await site.start()
+    bound_port = runner.addresses[0][1]
+    return runner, f"http://{host}:{bound_port}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stand-in research server for offline benchmarks")
+    parser.add_argument("--fixtures", default=DEFAULT_FIXTURES_DIR, help="Directory of recorded fixtures")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Added latency per request")
+    parser.add_argument("--latency-jitter-ms", type=float, default=0.0, help="Uniform jitter around the latency")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with 429/5xx")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for reproducible latency and errors")
+    args = parser.parse_args()
+
+    app = create_app(args.fixtures, args.latency_ms, args.latency_jitter_ms, args.error_rate, args.seed)
+    print(f"Stand-in serving {args.fixtures} on http://{args.host}:{args.port}")
+    print(f"Point the server at it with SEMINAR_TRANSPORT=replay SEMINAR_STANDIN_URL=http://{args.host}:{args.port}")
+    web.run_app(app, host=args.host, port=args.port, print=None)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,24 @@ import subprocess
 import os
 import time
 
+from deck_engine import DeckRenderer, load_deck
+
+# Presentation type -> deck spec in decks/
+DECKS = {
+    "Basic": "basic",
+    "Detailed": "detailed",
+    "Comprehensive": "comprehensive",
+    "High Quality": "high_quality",
+    "Lancet Integration": "lancet",
+}
+
+
+@st.cache_resource
+def get_renderer():
+    """One renderer per app process, so template prototypes are parsed once across reruns"""
+    return DeckRenderer()
+
+
 st.title("PG Seminar Presentation Generator")
 st.markdown("Automated tool for generating high-quality seminar presentations for CBME NMC Medical curriculum")
 
@@ -13,56 +31,35 @@ slides = st.sidebar.slider("Number of Slides", 10, 50, 25)
 include_visuals = st.sidebar.checkbox("Include Visualizations", True)
 presentation_type = st.sidebar.selectbox(
     "Presentation Type",
-    ["Basic", "Detailed", "Comprehensive", "High Quality", "Lancet Integration"]
+    list(DECKS)
 )
 
 if st.sidebar.button("Generate Presentation"):
     with st.spinner("Generating presentation..."):
         try:
-            if presentation_type == "Basic":
-                script = "generate_presentation.py"
-            elif presentation_type == "Detailed":
-                script = "generate_presentation_v2.py"
-            elif presentation_type == "Comprehensive":
-                script = "generate_presentation_v3.py"
-            elif presentation_type == "High Quality":
-                script = "generate_presentation_final.py"
-            else:
-                script = "generate_presentation_lancet.py"
-
-            # Run the Python script
-            result = subprocess.run(['python', script], capture_output=True, text=True)
-
-            if result.returncode == 0:
-                st.success("Presentation generated successfully!")
-
-                # Find the generated PPTX file
-                pptx_files = [f for f in os.listdir() if f.endswith('.pptx') and topic.lower().replace(' ', '_') in f.lower()]
-                if pptx_files:
-                    pptx_file = pptx_files[0]
-                    st.download_button(
-                        label="Download Presentation",
-                        data=open(pptx_file, 'rb'),
-                        file_name=pptx_file,
-                        mime='application/vnd.openxmlformats-officedocument.presentationml.presentation'
-                    )
+            # Render in-process and serve the deck from memory; nothing is written to disk
+            deck = load_deck(DECKS[presentation_type])
+            pptx_bytes = get_renderer().to_bytes(deck)
+            st.success("Presentation generated successfully!")
+            st.download_button(
+                label="Download Presentation",
+                data=pptx_bytes,
+                file_name=deck.output,
+                mime='application/vnd.openxmlformats-officedocument.presentationml.presentation'
+            )
 
-                    # Generate visualizations if requested
-                    if include_visuals:
-                        st.info("Generating visualizations...")
-                        vis_result = subprocess.run(['python', 'generate_visualizations.py'], capture_output=True, text=True)
-                        if vis_result.returncode == 0:
-                            st.success("Visualizations generated!")
-                            # Show visualization files
-                            png_files = [f for f in os.listdir() if f.endswith('.png')]
-                            if png_files:
-                                st.subheader("Visualization Assets")
-                                for png in png_files[:6]:  # Show first 6
-                                    st.image(png, caption=png, width=400)
-                else:
-                    st.error("No presentation file found. Please check the script output.")
-            else:
-                st.error(f"Error generating presentation: {result.stderr}")
+            # Generate visualizations if requested
+            if include_visuals:
+                st.info("Generating visualizations...")
+                vis_result = subprocess.run(['python', 'generate_visualizations.py'], capture_output=True, text=True)
+                if vis_result.returncode == 0:
+                    st.success("Visualizations generated!")
+                    # Show visualization files
+                    png_files = [f for f in os.listdir() if f.endswith('.png')]
+                    if png_files:
+                        st.subheader("Visualization Assets")
+                        for png in png_files[:6]:  # Show first 6
+                            st.image(png, caption=png, width=400)
 
         except Exception as e:
             st.error(f"An error occurred: {str(e)}")
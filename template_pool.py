@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Template prototype pool for the PG Seminar Presentation Generator
+Each template package (the python-pptx default or a custom institutional
+.pptx/.potx) is read and parsed once into a prototype Presentation. Decks
+get a deep copy of the prototype instead of re-parsing the package, and
+prefill() can prepare copies ahead of time so acquire() is just a pop.
+A .potx is read as the presentation it describes, since python-pptx only
+opens packages whose main part is a presentation.
+"""
+
+import copy
+import io
+import os
+import threading
+import zipfile
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple
+
+from pptx import Presentation
+
+TemplateKey = Tuple[Optional[str], float]
+
+TEMPLATE_CONTENT_TYPE = b"application/vnd.openxmlformats-officedocument.presentationml.template.main+xml"
+PRESENTATION_CONTENT_TYPE = b"application/vnd.openxmlformats-officedocument.presentationml.presentation.main+xml"
+
+
+def open_template(path: Optional[str] = None):
+    """Parse a .pptx or .potx template, or the python-pptx default when path is None"""
+    if path is None:
+        return Presentation()
+    if not path.lower().endswith(".potx"):
+        return Presentation(path)
+    # A template differs from a presentation only in its main part's content type
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(path) as source, zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as target:
+        for item in source.infolist():
+            data = source.read(item)
+            if item.filename == "[Content_Types].xml":
+                data = data.replace(TEMPLATE_CONTENT_TYPE, PRESENTATION_CONTENT_TYPE)
+            target.writestr(item, data)
+    buffer.seek(0)
+    return Presentation(buffer)
+
+
+class TemplatePool:
+    """Hand out independent Presentation objects cloned from parsed template prototypes"""
+
+    def __init__(self, max_ready: int = 8):
+        self.max_ready = max_ready
+        self._prototypes: Dict[TemplateKey, object] = {}
+        self._ready: Dict[TemplateKey, Deque[object]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(template: Optional[str]) -> TemplateKey:
+        """Key prototypes by absolute path and mtime so edited templates are re-parsed"""
+        if template is None:
+            return None, 0.0
+        path = os.path.abspath(template)
+        return path, os.path.getmtime(path)
+
+    def _prototype(self, key: TemplateKey):
+        with self._lock:
+            prototype = self._prototypes.get(key)
+            if prototype is None:
+                prototype = open_template(key[0])
+                # Drop prototypes of older versions of the same template file
+                for stale in [k for k in self._prototypes if k[0] == key[0]]:
+                    self._prototypes.pop(stale, None)
+                    self._ready.pop(stale, None)
+                self._prototypes[key] = prototype
+                self._ready[key] = deque()
+        return prototype
+
+    def acquire(self, template: Optional[str] = None):
+        """Return a fresh Presentation for the template, never shared with another caller"""
+        key = self._key(template)
+        prototype = self._prototype(key)
+        with self._lock:
+            ready = self._ready.get(key)
+            if ready:
+                return ready.popleft()
+        return copy.deepcopy(prototype)
+
+    def prefill(self, template: Optional[str] = None, count: int = 1) -> None:
+        """Clone prototypes ahead of time, e.g. while a worker is idle"""
+        key = self._key(template)
+        prototype = self._prototype(key)
+        for _ in range(count):
+            with self._lock:
+                ready = self._ready.setdefault(key, deque())
+                if len(ready) >= self.max_ready:
+                    return
+            clone = copy.deepcopy(prototype)
+            with self._lock:
+                self._ready.setdefault(key, deque()).append(clone)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._prototypes.clear()
+            self._ready.clear()
+
+
+# Shared by the deck engine and the MCP server's render workers
+default_pool = TemplatePool()
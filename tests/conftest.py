@@ -0,0 +1,6 @@
+import os
+import sys
+
+# The rendering modules live at the repository root and the MCP server in seminar-generator/
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [ROOT, os.path.join(ROOT, "seminar-generator")]
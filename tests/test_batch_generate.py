@@ -0,0 +1,32 @@
+import json
+import os
+
+import pytest
+
+from batch_generate import ManifestError, job_directory, load_manifest
+
+
+def _manifest(tmp_path, topics):
+    path = tmp_path / "syllabus.json"
+    path.write_text(json.dumps(topics, ensure_ascii=False), encoding="utf-8")
+    return str(path)
+
+
+@pytest.mark.parametrize("topics", [["COVID-19", "COVID 19"], ["मलेरिया", "क्षय रोग"]])
+def test_topics_with_the_same_slug_get_their_own_directories(tmp_path, topics):
+    jobs = load_manifest(_manifest(tmp_path, [{"topic": topic, "variant": "slides"} for topic in topics]))
+    first, second = (job_directory("out", job) for job in jobs)
+    assert first != second
+    assert os.path.basename(first) == os.path.basename(second) == "slides"
+
+
+def test_job_directory_is_stable_and_readable():
+    job = {"topic": "Social Determinants of Health", "variant": "full"}
+    assert job_directory("out", job) == job_directory("out", dict(job))
+    topic_directory = os.path.basename(os.path.dirname(job_directory("out", job)))
+    assert topic_directory.startswith("Social_Determinants_of_Health-")
+
+
+def test_duplicate_topics_are_rejected_regardless_of_case(tmp_path):
+    with pytest.raises(ManifestError, match="duplicate topic"):
+        load_manifest(_manifest(tmp_path, ["Malaria", "malaria"]))
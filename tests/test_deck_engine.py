@@ -0,0 +1,93 @@
+import glob
+import io
+import os
+import re
+from dataclasses import replace
+
+import pytest
+from pptx import Presentation
+
+import deck_engine
+from deck_engine import CONTINUED_SUFFIX, Bullet, DeckRenderer, DeckSpecError, load_deck, parse_deck
+from media_store import MediaStore
+
+DECK = {
+    "name": "test",
+    "slides": [
+        {"layout": "title", "title": "Determinants of Health", "subtitle": "Seminar"},
+        {"layout": "title_and_content", "title": "Points", "bullets": ["One", {"text": "Two", "level": 1}],
+         "notes": "Speaker notes"},
+        {"layout": "title_and_content", "title": "Chart", "chart": {
+            "type": "column_clustered", "categories": ["Rural", "Urban"],
+            "series": [{"name": "Malnutrition", "values": [40, 25.5]}]
+        }}
+    ]
+}
+
+
+@pytest.fixture
+def renderer(tmp_path):
+    return DeckRenderer(media=MediaStore(str(tmp_path / "media")))
+
+
+def _slides(blob):
+    return list(Presentation(io.BytesIO(blob)).slides)
+
+
+@pytest.mark.parametrize("path", sorted(glob.glob(os.path.join(deck_engine.DECKS_DIR, "*.json"))))
+def test_bundled_decks_are_valid(path):
+    assert load_deck(path).slides
+
+
+@pytest.mark.parametrize("change, field", [
+    ({"slides": []}, "<deck>.slides"),
+    ({"slides": [{"layout": "sidebar"}]}, "<deck>.slides[0].layout"),
+    ({"slides": [{"layout": "title", "bullets": ["x"]}]}, "<deck>.slides[0].bullets"),
+    ({"slides": [{"bullets": [{"text": "x", "level": 9}]}]}, "<deck>.slides[0].bullets[0].level"),
+    ({"slides": [{"chart": {"type": "column_clustered", "categories": ["a"],
+                            "series": [{"name": "s", "values": [1, 2]}]}}]},
+     "<deck>.slides[0].chart.series[0].values"),
+    ({"slides": [{"chart": {"type": "pie3d", "categories": ["a"], "series": []}}]}, "<deck>.slides[0].chart.type"),
+    ({"overflow": "scroll"}, "<deck>.overflow"),
+])
+def test_parse_errors_name_the_field(change, field):
+    with pytest.raises(DeckSpecError, match=f"^{re.escape(field)}:"):
+        parse_deck(dict(DECK, **change))
+
+
+def test_overflowing_bullets_continue_on_new_slides(renderer):
+    deck = parse_deck(DECK)
+    long_slide = replace(deck.slides[1], bullets=tuple(Bullet(f"Point number {i}") for i in range(40)))
+    planned = renderer.plan(replace(deck, slides=(long_slide,)))
+    assert len(planned.slides) > 1
+    assert planned.slides[0].notes == "Speaker notes"
+    assert all(slide.title == f"Points{CONTINUED_SUFFIX}" and slide.notes is None for slide in planned.slides[1:])
+    assert [b for slide in planned.slides for b in slide.bullets] == list(long_slide.bullets)
+
+    shrunk = renderer.plan(replace(deck, slides=(long_slide,), overflow="shrink"))
+    assert len(shrunk.slides) == 1 and shrunk.slides[0].font_scale < 100
+
+
+def test_streamed_deck_matches_in_memory_deck(renderer):
+    deck = parse_deck(DECK)
+    built, streamed = _slides(renderer.to_bytes(deck)), _slides(renderer.to_bytes(deck, streaming=True))
+    assert len(built) == len(streamed) == 3
+    for a, b in zip(built, streamed):
+        assert [shape.shape_type for shape in a.shapes] == [shape.shape_type for shape in b.shapes]
+        assert [shape.text_frame.text for shape in a.shapes if shape.has_text_frame] == \
+            [shape.text_frame.text for shape in b.shapes if shape.has_text_frame]
+    assert streamed[1].notes_slide.notes_text_frame.text == "Speaker notes"
+    assert any(shape.has_chart for shape in streamed[2].shapes)
+
+
+def test_rebuild_reuses_unchanged_slides(renderer, tmp_path):
+    output = str(tmp_path / "test.pptx")
+    deck = parse_deck(DECK)
+    assert renderer.rebuild(deck, output) == (output, 0)
+    assert renderer.rebuild(deck, output) == (output, 3)
+
+    edited = replace(deck, slides=(deck.slides[0], replace(deck.slides[1], title="Edited"), deck.slides[2]))
+    assert renderer.rebuild(edited, output) == (output, 2)
+    slides = _slides(open(output, "rb").read())
+    assert [slide.shapes.title.text for slide in slides] == ["Determinants of Health", "Edited", "Chart"]
+    assert slides[1].notes_slide.notes_text_frame.text == "Speaker notes"
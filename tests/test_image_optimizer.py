@@ -0,0 +1,61 @@
+import io
+
+import pytest
+from PIL import Image
+
+from image_optimizer import display_pixels, optimize_image
+
+
+def _png(image: Image.Image, **options) -> bytes:
+    buffer = io.BytesIO()
+    image.save(buffer, "PNG", **options)
+    return buffer.getvalue()
+
+
+def _flat(mode: str, background, foreground) -> Image.Image:
+    image = Image.new(mode, (400, 300), background)
+    image.paste(foreground, (0, 0, 100, 100))
+    return image
+
+
+def test_display_pixels_keeps_aspect_ratio_without_height():
+    blob = _png(Image.new("RGB", (800, 400)))
+    assert display_pixels(blob, 2.0, None, 100) == (200, 100)
+    assert display_pixels(blob, 2.0, 3.0, 100) == (200, 300)
+
+
+@pytest.mark.parametrize("image", [
+    _flat("RGB", (255, 255, 255), (200, 30, 30)),
+    _flat("RGBA", (255, 255, 255, 255), (200, 30, 30, 255)),
+    # Flat images with transparency: LA cannot be quantized directly
+    _flat("LA", (200, 255), (50, 128)),
+    _flat("RGBA", (255, 255, 255, 0), (200, 30, 30, 255)),
+], ids=["rgb", "rgba-opaque", "la-translucent", "rgba-translucent"])
+def test_flat_images_stay_pngs_no_larger_than_the_source(image):
+    blob = _png(image)
+    optimized, ext = optimize_image(blob, (200, 150))
+    assert ext == "png"
+    assert len(optimized) <= len(blob)
+    with Image.open(io.BytesIO(optimized)) as result:
+        assert result.size in ((200, 150), (400, 300))
+
+
+def test_palette_image_with_transparency():
+    image = _flat("RGBA", (0, 0, 0, 0), (30, 120, 200, 255)).convert("P")
+    image.info["transparency"] = 0
+    optimized, ext = optimize_image(_png(image, transparency=0), (200, 150))
+    assert ext == "png"
+    with Image.open(io.BytesIO(optimized)) as result:
+        assert result.size in ((200, 150), (400, 300))
+
+
+def test_source_is_kept_when_reencoding_does_not_help():
+    blob = _png(Image.new("L", (10, 10), 255))
+    assert optimize_image(blob, (100, 100)) == (blob, "png")
+
+
+def test_images_are_never_upscaled():
+    blob = _png(_flat("RGB", (255, 255, 255), (0, 0, 0)))
+    optimized, _ = optimize_image(blob, (4000, 3000))
+    with Image.open(io.BytesIO(optimized)) as result:
+        assert result.size == (400, 300)
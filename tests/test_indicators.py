@@ -0,0 +1,120 @@
+import json
+import os
+
+import pytest
+
+import deck_engine
+import indicators
+from indicators import IndicatorStore
+
+HEADER = "indicator,geography,group,year,value,unit,source\n"
+ROWS = (
+    "life_expectancy,High-Income Countries,All,,82,years,test\n"
+    "life_expectancy,India,All,2020,70,years,test\n"
+    "malnutrition_rate,India,Rural,2021,40,%,test\n"
+    "malnutrition_rate,India,Urban,2021,25.5,%,test\n"
+)
+
+
+def _write(path, text, mtime=None):
+    path.write_text(text, encoding="utf-8")
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+
+
+@pytest.fixture
+def store(tmp_path):
+    _write(tmp_path / "health.v1.csv", HEADER + ROWS)
+    return IndicatorStore(str(tmp_path))
+
+
+def test_query_selects_on_every_index_level(store):
+    rows = store.query(indicator="malnutrition_rate", geography="India", group=["Rural"], year=2021)
+    assert rows["value"].tolist() == [40.0]
+    assert len(store.query(indicator="life_expectancy")) == 2
+
+
+def test_chart_data_orders_relabels_and_keeps_whole_numbers_as_ints(store):
+    data = store.chart_data({"Life Expectancy": "life_expectancy"}, by="geography",
+                            categories=["India", "High-Income Countries"], labels={"India": "India Average"})
+    assert data == {"categories": ("India Average", "High-Income Countries"),
+                    "series": (("Life Expectancy", (70, 82)),)}
+    assert type(data["series"][0][1][0]) is int
+    rates = store.chart_data({"Rate": "malnutrition_rate"}, by="group", geography="India")
+    assert rates["series"] == (("Rate", (40, 25.5)),)
+
+
+@pytest.mark.parametrize("kwargs, message", [
+    (dict(series={"x": "missing"}, by="group"), "No rows"),
+    (dict(series={"x": "malnutrition_rate"}, by="indicator"), "can be drawn by"),
+    (dict(series={"x": "malnutrition_rate"}, by="group", region="India"), "Unknown indicator filters"),
+    (dict(series={"x": "life_expectancy"}, by="group"), "Several rows"),
+    (dict(series={"x": "malnutrition_rate"}, by="group", categories=["Rural", "Tribal"]), "malnutrition_rate for Tribal"),
+])
+def test_chart_data_errors(store, kwargs, message):
+    with pytest.raises(ValueError, match=message):
+        store.chart_data(**kwargs)
+
+
+def test_newest_version_unless_pinned(tmp_path, store):
+    _write(tmp_path / "health.v2.csv", HEADER + ROWS.replace(",70,", ",71,"))
+    assert store.datasets()["health"][0] == 2
+    assert store.query(indicator="life_expectancy", geography="India")["value"].tolist() == [71.0]
+    pinned = IndicatorStore(str(tmp_path), versions={"health": 1})
+    assert pinned.query(indicator="life_expectancy", geography="India")["value"].tolist() == [70.0]
+    with pytest.raises(ValueError, match="no version 3"):
+        IndicatorStore(str(tmp_path), versions={"health": 3}).datasets()
+
+
+def test_edited_dataset_is_read_again(tmp_path, store):
+    path = tmp_path / "health.v1.csv"
+    _write(path, HEADER + ROWS, mtime=1_000_000)
+    assert store.query(indicator="life_expectancy", geography="India")["value"].tolist() == [70.0]
+    _write(path, HEADER + ROWS.replace(",70,", ",71,"), mtime=2_000_000)
+    assert store.query(indicator="life_expectancy", geography="India")["value"].tolist() == [71.0]
+
+
+def test_duplicate_rows_are_rejected(tmp_path):
+    _write(tmp_path / "a.v1.csv", HEADER + ROWS)
+    _write(tmp_path / "b.v1.csv", HEADER + ROWS)
+    with pytest.raises(ValueError, match="more than once"):
+        IndicatorStore(str(tmp_path)).frame()
+
+
+def test_load_deck_sees_edited_indicator_data(tmp_path, store, monkeypatch):
+    monkeypatch.setattr(indicators, "default_store", store)
+    deck_path = tmp_path / "deck.json"
+    deck_path.write_text(json.dumps({"slides": [{
+        "layout": "title_only",
+        "title": "Life expectancy",
+        "chart": {"type": "column_clustered",
+                  "query": {"series": {"Years": "life_expectancy"}, "by": "geography"}}
+    }]}), encoding="utf-8")
+    csv_path = tmp_path / "health.v1.csv"
+    _write(csv_path, HEADER + ROWS, mtime=1_000_000)
+    assert deck_engine.load_deck(str(deck_path)).slides[0].chart.series == (("Years", (82, 70)),)
+
+    _write(csv_path, HEADER + ROWS.replace(",70,", ",71,"), mtime=2_000_000)
+    assert deck_engine.load_deck(str(deck_path)).slides[0].chart.series == (("Years", (82, 71)),)
+
+
+def test_deck_query_errors_name_the_field(store, monkeypatch):
+    monkeypatch.setattr(indicators, "default_store", store)
+    data = {"slides": [{"layout": "title_only", "title": "x",
+                        "chart": {"type": "column_clustered", "query": {"series": {"x": "missing"}, "by": "group"}}}]}
+    with pytest.raises(deck_engine.DeckSpecError, match=r"deck\.slides\[0\]\.chart\.query: No rows"):
+        deck_engine.parse_deck(data, "deck")
+
+
+def test_parquet_without_an_engine_is_a_deck_spec_error(tmp_path, monkeypatch):
+    def read_parquet(path):
+        raise ImportError("Unable to find a usable engine")
+
+    (tmp_path / "health.v2.parquet").write_bytes(b"PAR1")
+    monkeypatch.setattr(indicators.pd, "read_parquet", read_parquet)
+    monkeypatch.setattr(indicators, "default_store", IndicatorStore(str(tmp_path)))
+    data = {"slides": [{"layout": "title_only", "title": "x",
+                        "chart": {"type": "column_clustered",
+                                  "query": {"series": {"x": "life_expectancy"}, "by": "geography"}}}]}
+    with pytest.raises(deck_engine.DeckSpecError, match="needs pyarrow or fastparquet"):
+        deck_engine.parse_deck(data, "deck")
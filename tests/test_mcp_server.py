@@ -0,0 +1,125 @@
+import asyncio
+import os
+
+import pytest
+
+import mcp_server
+from mcp_server import SeminarGeneratorServer
+from research_cache import MISSING, ResearchCache
+from resilience import HttpResult, UpstreamError
+
+
+def _crash_once(marker: str) -> int:
+    """Kill the worker the first time, as an out-of-memory kill would"""
+    if not os.path.exists(marker):
+        open(marker, "w").close()
+        os._exit(1)
+    return os.getpid()
+
+
+def test_broken_render_pool_is_replaced(tmp_path, monkeypatch):
+    monkeypatch.setenv("SEMINAR_RENDER_WORKERS", "1")
+    monkeypatch.setenv("SEMINAR_CACHE_DIR", str(tmp_path))
+    # Spawned workers only need to import this module, not the whole rendering stack
+    monkeypatch.setattr(mcp_server, "_warm_render_worker", mcp_server._noop)
+    marker = str(tmp_path / "crashed")
+
+    async def run():
+        async with SeminarGeneratorServer() as server:
+            broken = server.get_render_pool()
+            assert await server.run_render(_crash_once, marker) != os.getpid()
+            assert server._render_pool is not broken
+            assert await server.run_render(_crash_once, marker) != os.getpid()
+
+    asyncio.run(run())
+
+
+class _SlowServer:
+    """Answers tools/call after a delay taken from the request, everything else at once"""
+
+    def __init__(self):
+        self.warmed_up = False
+
+    async def handle_request(self, request):
+        if request["method"] == "boom":
+            raise RuntimeError("bad request")
+        await asyncio.sleep(request.get("params", {}).get("delay", 0))
+        return {"jsonrpc": "2.0", "id": request.get("id"), "result": request["method"]}
+
+    def start_warm_up(self):
+        self.warmed_up = True
+
+
+def test_dispatcher_answers_out_of_order_and_matches_ids():
+    server = _SlowServer()
+    written = []
+
+    async def run():
+        dispatcher = mcp_server.RequestDispatcher(server, max_concurrency=2)
+
+        async def write(message):
+            written.append(message)
+
+        dispatcher.write = write
+        dispatcher.dispatch({"id": 1, "method": "tools/call", "params": {"delay": 0.05}})
+        dispatcher.dispatch({"id": 2, "method": "initialize"})
+        dispatcher.dispatch({"id": 3, "method": "boom"})
+        dispatcher.dispatch({"method": "notifications/initialized"})
+        await dispatcher.drain()
+
+    asyncio.run(run())
+    # The slow tool call must not hold back the quick answers, and the notification gets none
+    assert [message["id"] for message in written][-1] == 1
+    by_id = {message["id"]: message for message in written}
+    assert sorted(by_id) == [1, 2, 3]
+    assert by_id[1]["result"] == "tools/call"
+    assert by_id[2]["result"] == "initialize"
+    assert by_id[3]["error"]["code"] == -32603
+    assert server.warmed_up
+
+
+ESEARCH = "<eSearchResult><IdList><Id>101</Id></IdList></eSearchResult>"
+EFETCH = ("<PubmedArticleSet><PubmedArticle><MedlineCitation><PMID>101</PMID>"
+          "<Article><ArticleTitle>Fresh</ArticleTitle></Article></MedlineCitation></PubmedArticle></PubmedArticleSet>")
+STALE = [{"pmid": "100", "title": "Stale", "abstract": "No abstract"}]
+
+
+def _research_server(tmp_path, monkeypatch, esearch_status=200, efetch_status=200):
+    async def send(method, url, sink=None, **kwargs):
+        if "esearch" in url:
+            return HttpResult(esearch_status, ESEARCH if esearch_status == 200 else "Bad Request")
+        if efetch_status == 200:
+            sink(EFETCH.encode("utf-8"))
+        return HttpResult(efetch_status, "")
+
+    now = [1000.0]
+    monkeypatch.setattr("research_cache.time.time", lambda: now[0])
+    cache = ResearchCache(str(tmp_path), ttls={"pubmed": 60})
+    server = SeminarGeneratorServer(cache=cache)
+    server.http.send = send
+    return server, cache, now
+
+
+def _cached_pubmed(server):
+    return server.cached_fetch("pubmed", "malaria", server.fetch_pubmed, "malaria")
+
+
+def test_failed_esearch_is_not_cached_as_no_articles(tmp_path, monkeypatch):
+    server, cache, _ = _research_server(tmp_path, monkeypatch, esearch_status=400)
+    with pytest.raises(UpstreamError):
+        asyncio.run(_cached_pubmed(server))
+    assert cache.get("pubmed", "malaria", allow_stale=True) is MISSING
+
+    cache.set("pubmed", "malaria", STALE)
+    assert asyncio.run(_cached_pubmed(server)) == STALE
+
+
+def test_failed_efetch_serves_the_stale_complete_batch(tmp_path, monkeypatch):
+    server, cache, now = _research_server(tmp_path, monkeypatch, efetch_status=400)
+    partial = asyncio.run(_cached_pubmed(server))
+    assert partial == [{"pmid": "101", "title": None, "abstract": None}]
+    assert cache.get("pubmed", "malaria", allow_stale=True) is MISSING
+
+    cache.set("pubmed", "malaria", STALE)
+    now[0] += 3600
+    assert asyncio.run(_cached_pubmed(server)) == STALE
@@ -0,0 +1,53 @@
+import io
+
+from PIL import Image
+
+from media_store import MediaStore
+
+
+def _png(path, size=(400, 300)):
+    Image.new("RGB", size, (20, 120, 200)).save(path, format="PNG")
+    return path
+
+
+def test_identical_blobs_share_one_item(tmp_path):
+    store = MediaStore(str(tmp_path))
+    first = store.put(b"image bytes", ".PNG")
+    second = store.put(b"image bytes", "png")
+    assert first == second
+    assert first.ext == "png"
+    assert (tmp_path / first.digest[:2] / f"{first.digest}.png").read_bytes() == b"image bytes"
+
+
+def test_blobs_are_found_by_another_store_on_the_same_directory(tmp_path):
+    item = MediaStore(str(tmp_path)).put(b"image bytes", "png")
+    assert MediaStore(str(tmp_path)).get(item.digest, "png") == item
+    assert MediaStore().get(item.digest, "png") is None
+
+
+def test_memory_is_bounded_by_least_recent_use():
+    store = MediaStore(max_memory_bytes=10)
+    first = store.put(b"123456", "bin")
+    second = store.put(b"abcdef", "bin")
+    assert store.get(first.digest, "bin") is None
+    assert store.get(second.digest, "bin") == second
+
+
+def test_changed_source_file_is_read_again(tmp_path):
+    path = _png(tmp_path / "photo.png")
+    store = MediaStore()
+    first = store.load(str(path))
+    assert store.load(str(path)) is first
+    _png(path, (300, 300))
+    assert store.load(str(path)).digest != first.digest
+
+
+def test_optimized_variants_are_reused(tmp_path):
+    path = _png(tmp_path / "photo.png", (2000, 1500))
+    store = MediaStore(str(tmp_path / "media"))
+    variant = store.optimized(str(path), 2.0, None, 100)
+    assert Image.open(io.BytesIO(variant.blob)).size == (200, 150)
+
+    # A fresh process finds the variant on disk instead of re-encoding it
+    other = MediaStore(str(tmp_path / "media"))
+    assert other.optimized(str(path), 2.0, None, 100) == variant
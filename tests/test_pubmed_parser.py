@@ -0,0 +1,104 @@
+import asyncio
+import xml.etree.ElementTree as ET
+
+import pytest
+
+import mcp_server
+from pubmed_parser import PubmedArticleParser, iter_pubmed_articles
+from resilience import HttpResult
+
+EFETCH = """<?xml version="1.0" ?>
+<PubmedArticleSet>
+  <PubmedArticle>
+    <MedlineCitation>
+      <PMID>101</PMID>
+      <Article>
+        <Journal>
+          <JournalIssue><PubDate><MedlineDate>2019 Nov-Dec</MedlineDate></PubDate></JournalIssue>
+          <Title>Journal of Rural Health</Title>
+        </Journal>
+        <ArticleTitle>Anaemia in <i>rural</i> districts</ArticleTitle>
+        <Abstract>
+          <AbstractText Label="BACKGROUND">Iron status matters.</AbstractText>
+          <AbstractText Label="RESULTS">Prevalence was 53<sup>%</sup>.</AbstractText>
+        </Abstract>
+      </Article>
+    </MedlineCitation>
+    <PubmedData>
+      <ArticleIdList><ArticleId IdType="doi">10.1000/anaemia</ArticleId></ArticleIdList>
+    </PubmedData>
+  </PubmedArticle>
+  <PubmedArticle>
+    <MedlineCitation>
+      <PMID>102</PMID>
+      <Article>
+        <Journal><JournalIssue><PubDate><Year>2022</Year></PubDate></JournalIssue></Journal>
+        <ArticleTitle>Immunisation coverage</ArticleTitle>
+      </Article>
+    </MedlineCitation>
+  </PubmedArticle>
+</PubmedArticleSet>
+"""
+
+ESEARCH = "<eSearchResult><IdList><Id>101</Id><Id>102</Id></IdList></eSearchResult>"
+
+
+def test_articles_are_parsed_from_small_chunks():
+    data = EFETCH.encode("utf-8")
+    chunks = [data[start:start + 7] for start in range(0, len(data), 7)]
+    first, second = iter_pubmed_articles(chunks)
+
+    assert first["pmid"] == "101"
+    assert first["title"] == "Anaemia in rural districts"
+    assert first["abstract"] == "Iron status matters. Prevalence was 53%."
+    assert [section["label"] for section in first["abstract_sections"]] == ["BACKGROUND", "RESULTS"]
+    assert first["year"] == "2019"
+    assert first["doi"] == "10.1000/anaemia"
+    assert second["pmid"] == "102"
+    assert second["abstract"] == "No abstract"
+    assert second["year"] == "2022"
+
+
+def test_truncated_body_is_reported_on_close():
+    found = []
+    parser = PubmedArticleParser(found.append)
+    parser.feed(EFETCH[:EFETCH.index("<PMID>102")])
+    assert [article["pmid"] for article in found] == ["101"]
+    with pytest.raises(ET.ParseError):
+        parser.close()
+
+
+def _server(monkeypatch, tmp_path, send):
+    monkeypatch.setenv("SEMINAR_CACHE_DIR", str(tmp_path))
+    server = mcp_server.SeminarGeneratorServer()
+    server.http.send = send
+    return server
+
+
+def test_fetch_pubmed_streams_efetch_body(monkeypatch, tmp_path):
+    async def send(method, url, sink=None, **kwargs):
+        if "esearch" in url:
+            return HttpResult(200, ESEARCH)
+        assert sink is not None
+        data = EFETCH.encode("utf-8")
+        for start in range(0, len(data), 64):
+            sink(data[start:start + 64])
+        return HttpResult(200, "")
+
+    server = _server(monkeypatch, tmp_path, send)
+    articles = asyncio.run(server.fetch_pubmed("anaemia"))
+    assert [article["title"] for article in articles] == ["Anaemia in rural districts", "Immunisation coverage"]
+
+
+def test_fetch_pubmed_logs_malformed_efetch(monkeypatch, tmp_path, capsys):
+    async def send(method, url, sink=None, **kwargs):
+        if "esearch" in url:
+            return HttpResult(200, ESEARCH)
+        sink(EFETCH[:EFETCH.index("<PMID>102")].encode("utf-8"))
+        return HttpResult(200, "")
+
+    server = _server(monkeypatch, tmp_path, send)
+    articles = asyncio.run(server.fetch_pubmed("anaemia"))
+    assert articles[0]["title"] == "Anaemia in rural districts"
+    assert articles[1] == {"pmid": "102", "title": None, "abstract": None}
+    assert "PubMed efetch failed" in capsys.readouterr().err
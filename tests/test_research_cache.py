@@ -0,0 +1,57 @@
+import pytest
+
+from research_cache import MISSING, ResearchCache, normalize_topic
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = ResearchCache(str(tmp_path), ttls={"wikipedia": 60})
+    yield cache
+    cache.close()
+
+
+def test_topics_are_normalized():
+    assert normalize_topic("  Social   Determinants of HEALTH ") == "social determinants of health"
+
+
+def test_values_round_trip_and_none_is_a_hit(cache):
+    cache.set("wikipedia", "malaria", {"extract": "Malaria is..."})
+    cache.set("wikipedia", "unknown", None)
+    assert cache.get("wikipedia", "malaria") == {"extract": "Malaria is..."}
+    assert cache.get("wikipedia", "unknown") is None
+    assert cache.get("wikipedia", "tuberculosis") is MISSING
+
+
+def test_expired_entries_are_only_served_stale(cache, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("research_cache.time.time", lambda: now[0])
+    cache.set("wikipedia", "malaria", "extract")
+    now[0] += 61
+    assert cache.get("wikipedia", "malaria") is MISSING
+    assert cache.get("wikipedia", "malaria", allow_stale=True) == "extract"
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("research_cache.time.time", lambda: now[0])
+    cache = ResearchCache(str(tmp_path), max_bytes=250)
+    for key in ("a", "b"):
+        cache.set("pubmed", key, "x" * 100)
+        now[0] += 1
+    cache.get("pubmed", "a")
+    now[0] += 1
+    cache.set("pubmed", "c", "x" * 100)
+
+    assert cache.get("pubmed", "b") is MISSING
+    assert cache.get("pubmed", "a") == "x" * 100
+    assert cache.get("pubmed", "c") == "x" * 100
+    cache.close()
+
+
+def test_entries_persist_across_instances(tmp_path):
+    first = ResearchCache(str(tmp_path))
+    first.set("pubmed", "malaria", [{"pmid": "1"}])
+    first.close()
+    second = ResearchCache(str(tmp_path))
+    assert second.get("pubmed", "malaria") == [{"pmid": "1"}]
+    second.close()
@@ -0,0 +1,56 @@
+import asyncio
+import json
+
+from research_transport import RecordingTransport, ReplayTransport, fixture_key, request_key
+from resilience import HttpResult
+
+EFETCH_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi"
+
+
+def test_fixture_key_ignores_parameter_order_quoting_and_secrets():
+    key = fixture_key("get", "Example.org", "/wiki/Public%20health", [("b", "2"), ("a", "1")])
+    assert key == fixture_key("GET", "example.org", "/wiki/Public health", [("a", "1"), ("b", "2"), ("api_key", "x")])
+    assert key != fixture_key("POST", "example.org", "/wiki/Public health", [("a", "1"), ("b", "2")])
+
+
+def test_request_key_merges_url_query_and_params():
+    assert request_key("GET", f"{EFETCH_URL}?db=pubmed", {"id": "1"}) == \
+        request_key("GET", EFETCH_URL, {"id": "1", "db": "pubmed"})
+
+
+class _StreamingInner:
+    async def send(self, method, url, sink=None, **kwargs):
+        for chunk in (b"<PubmedArticleSet>", "<PMID>µ</PMID>".encode("utf-8"), b"</PubmedArticleSet>"):
+            sink(chunk)
+        return HttpResult(200, "", {"Content-Type": "text/xml", "Set-Cookie": "secret"})
+
+    async def close(self):
+        pass
+
+
+def test_recorded_streamed_body_is_replayed(tmp_path):
+    params = {"db": "pubmed", "id": "1", "api_key": "secret"}
+
+    async def run():
+        received = []
+        recorder = RecordingTransport(_StreamingInner(), str(tmp_path))
+        await recorder.send("GET", EFETCH_URL, sink=received.append, params=params)
+
+        replay = ReplayTransport(str(tmp_path))
+        try:
+            replayed = []
+            result = await replay.send("GET", EFETCH_URL, sink=replayed.append, params=params)
+            text = await replay.send("GET", EFETCH_URL, params=params)
+        finally:
+            await replay.close()
+        return b"".join(received), b"".join(replayed), result, text
+
+    received, replayed, result, text = asyncio.run(run())
+    body = "<PubmedArticleSet><PMID>µ</PMID></PubmedArticleSet>"
+    assert received == replayed == body.encode("utf-8")
+    assert result.status == 200
+    assert text.text == body
+
+    fixture = json.loads(next(tmp_path.rglob("*.json")).read_text(encoding="utf-8"))
+    assert fixture["headers"] == {"Content-Type": "text/xml"}
+    assert "secret" not in json.dumps(fixture)
@@ -0,0 +1,83 @@
+import asyncio
+
+import pytest
+
+from resilience import CircuitBreaker, CircuitOpenError, HttpResult, ResilientFetcher, UpstreamError
+
+URL = "https://example.org/resource"
+
+
+def _fetcher(send, **options):
+    options.setdefault("base_delay", 0.0)
+    options.setdefault("default_rate", 1000.0)
+    return ResilientFetcher(send, **options)
+
+
+def test_breaker_opens_after_threshold_and_allows_one_trial(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("resilience.time.monotonic", lambda: now[0])
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10)
+    breaker.record_failure()
+    assert breaker.state == "closed"
+    breaker.record_failure()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request("host")
+
+    now[0] += 10
+    assert breaker.before_request("host") is True
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request("host")
+    breaker.record_success()
+    assert breaker.state == "closed"
+    assert breaker.before_request("host") is False
+
+
+def test_retries_5xx_then_succeeds():
+    statuses = [503, 500, 200]
+
+    async def send(method, url, **kwargs):
+        return HttpResult(statuses.pop(0), "ok")
+
+    result = asyncio.run(_fetcher(send, retries=3).fetch("GET", URL))
+    assert result.status == 200 and not statuses
+
+
+def test_exhausted_retries_raise_and_count_as_one_failure():
+    async def send(method, url, **kwargs):
+        return HttpResult(429, "slow down", {"Retry-After": "0"})
+
+    fetcher = _fetcher(send, retries=2, failure_threshold=5)
+    with pytest.raises(UpstreamError):
+        asyncio.run(fetcher.fetch("GET", URL))
+    assert fetcher._policy("example.org")[1].failures == 1
+
+
+def test_cancelled_trial_does_not_block_the_host(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("resilience.time.monotonic", lambda: now[0])
+
+    async def run():
+        hang = asyncio.Event()
+
+        async def send(method, url, **kwargs):
+            if not hang.is_set():
+                await asyncio.sleep(3600)
+            return HttpResult(200, "ok")
+
+        fetcher = _fetcher(send, retries=0, failure_threshold=1, reset_timeout=10)
+        breaker = fetcher._policy("example.org")[1]
+        breaker.record_failure()
+        now[0] += 10
+
+        # The half-open trial is cancelled, e.g. because the client went away
+        trial = asyncio.ensure_future(fetcher.fetch("GET", URL))
+        await asyncio.sleep(0)
+        trial.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await trial
+
+        hang.set()
+        result = await fetcher.fetch("GET", URL)
+        assert result.status == 200 and breaker.state == "closed"
+
+    asyncio.run(run())
@@ -0,0 +1,37 @@
+import io
+import zipfile
+
+from pptx import Presentation
+
+from deck_engine import DeckRenderer, parse_deck
+from template_pool import PRESENTATION_CONTENT_TYPE, TEMPLATE_CONTENT_TYPE, TemplatePool
+
+
+def _potx(path):
+    """Save the default template as a .potx, as PowerPoint would"""
+    buffer = io.BytesIO()
+    Presentation().save(buffer)
+    with zipfile.ZipFile(buffer) as source, zipfile.ZipFile(path, "w") as target:
+        for item in source.infolist():
+            data = source.read(item)
+            if item.filename == "[Content_Types].xml":
+                data = data.replace(PRESENTATION_CONTENT_TYPE, TEMPLATE_CONTENT_TYPE)
+            target.writestr(item, data)
+    return str(path)
+
+
+def test_clones_are_independent():
+    pool = TemplatePool()
+    first, second = pool.acquire(), pool.acquire()
+    first.slides.add_slide(first.slide_layouts[0])
+    assert len(first.slides) == 1 and len(second.slides) == 0
+
+
+def test_potx_templates_render_as_presentations(tmp_path):
+    template = _potx(tmp_path / "institution.potx")
+    deck = parse_deck({"template": template, "slides": [{"layout": "title", "title": "Malaria"}]})
+    blob = DeckRenderer(pool=TemplatePool()).to_bytes(deck)
+
+    assert Presentation(io.BytesIO(blob)).slides[0].shapes.title.text == "Malaria"
+    with zipfile.ZipFile(io.BytesIO(blob)) as package:
+        assert PRESENTATION_CONTENT_TYPE in package.read("[Content_Types].xml")
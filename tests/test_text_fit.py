@@ -0,0 +1,47 @@
+from text_fit import BodyMetrics, fits, paginate, shrink_scale, text_height
+
+LEVELS = 9
+METRICS = BodyMetrics(
+    font="Arial",
+    width=300.0,
+    height=100.0,
+    sizes=(20.0,) * LEVELS,
+    margins=(0.0,) * LEVELS,
+    space_before_pct=(0.0,) * LEVELS,
+    space_before_pts=(0.0,) * LEVELS,
+    line_spacing=(1.0,) * LEVELS
+)
+# 20 pt lines are 24 pt tall, so four single-line bullets fit in 100 pt
+LINE = 24.0
+
+
+def test_short_bullets_take_one_line_each():
+    assert text_height(METRICS, ["One", "Two"]) == 2 * LINE
+    assert fits(METRICS, ["One", "Two", "Three", "Four"])
+    assert not fits(METRICS, ["One", "Two", "Three", "Four", "Five"])
+
+
+def test_long_bullets_wrap():
+    long_bullet = " ".join(["determinants"] * 10)
+    assert text_height(METRICS, [long_bullet]) > 2 * LINE
+
+
+def test_paginate_keeps_order_and_fills_pages():
+    bullets = [f"Point {i}" for i in range(10)]
+    pages = paginate(METRICS, bullets)
+    assert [len(page) for page in pages] == [4, 4, 2]
+    assert [item for page in pages for item in page] == bullets
+
+
+def test_paragraph_too_tall_for_a_page_gets_its_own():
+    tall = " ".join(["determinants"] * 40)
+    assert paginate(METRICS, ["Intro", tall, "Outro"]) == [["Intro"], [tall], ["Outro"]]
+
+
+def test_shrink_scale_finds_largest_fitting_scale():
+    bullets = [f"Point {i}" for i in range(5)]
+    scale = shrink_scale(METRICS, bullets)
+    assert 50 <= scale < 100
+    assert fits(METRICS, bullets, scale / 100)
+    assert not fits(METRICS, bullets, (scale + 1) / 100)
+    assert shrink_scale(METRICS, bullets[:4]) == 100
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Text overflow estimation for the PG Seminar Presentation Generator
+Estimates how tall a bullet list renders in a slide's body placeholder from
+precomputed glyph-width tables and the template's text styles, without
+rasterizing anything, so it is cheap enough to run on every slide of every
+deck. Overflowing lists can be split into pages or given a font scale found
+by binary search.
+"""
+
+import math
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from lxml import etree
+from pptx.enum.shapes import PP_PLACEHOLDER
+from pptx.enum.text import MSO_AUTO_SIZE
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.oxml.ns import nsmap
+
+EMU_PER_POINT = 12700
+# Single line spacing as a multiple of the font size
+LINE_HEIGHT = 1.2
+MIN_FONT_SCALE = 50
+LEVELS = 9
+
+# Advance widths in 1/1000 em of the printable ASCII characters (space to "~").
+# Arial's are the metric-compatible Helvetica AFM widths; Calibri's are rounded from its hmtx table.
+_ASCII = "".join(chr(c) for c in range(32, 127))
+GLYPH_WIDTHS = {
+    "Calibri": dict(zip(_ASCII, (
+        226, 268, 401, 507, 507, 714, 682, 221, 303, 303, 507, 507, 250, 306, 252, 386,
+        507, 507, 507, 507, 507, 507, 507, 507, 507, 507, 268, 268, 507, 507, 507, 461,
+        856, 579, 544, 533, 615, 488, 459, 631, 623, 252, 319, 520, 420, 855, 646, 662,
+        517, 673, 543, 459, 487, 642, 567, 890, 519, 487, 468, 309, 386, 309, 507, 507,
+        281, 479, 525, 423, 525, 498, 305, 471, 525, 229, 239, 455, 229, 799, 525, 527,
+        525, 525, 349, 391, 335, 525, 452, 715, 433, 453, 395, 319, 459, 319, 507
+    ))),
+    "Arial": dict(zip(_ASCII, (
+        278, 278, 355, 556, 556, 889, 667, 191, 333, 333, 389, 584, 278, 333, 278, 278,
+        556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 278, 278, 584, 584, 584, 556,
+        1015, 667, 667, 722, 722, 667, 611, 778, 722, 278, 500, 667, 556, 833, 722, 778,
+        667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 278, 278, 278, 469, 556,
+        333, 556, 556, 500, 556, 556, 278, 556, 556, 222, 222, 500, 222, 833, 556, 556,
+        556, 556, 333, 500, 278, 556, 500, 722, 500, 500, 500, 334, 260, 334, 584
+    ))),
+}
+# Fonts without a table are measured as Arial, which is wider than most body fonts
+FALLBACK_FONT = "Arial"
+# Other Latin, Greek and punctuation (e.g. bullets and dashes) vs. CJK and emoji
+OTHER_WIDTH = 556
+WIDE_WIDTH = 1000
+
+_LINE_BREAK = re.compile("[\n\v]")
+_NS = nsmap("a", "p")
+_LEVEL_PPR = [etree.XPath(f"./a:lvl{level + 1}pPr", namespaces=_NS) for level in range(LEVELS)]
+_FONT_SIZE = etree.XPath("./a:defRPr/@sz", namespaces=_NS)
+_SPACE_BEFORE_PCT = etree.XPath("./a:spcBef/a:spcPct/@val", namespaces=_NS)
+_SPACE_BEFORE_PTS = etree.XPath("./a:spcBef/a:spcPts/@val", namespaces=_NS)
+_LINE_SPACING = etree.XPath("./a:lnSpc/a:spcPct/@val", namespaces=_NS)
+_BODY_STYLE = etree.XPath("./p:txStyles/p:bodyStyle", namespaces=_NS)
+_LIST_STYLE = etree.XPath("./p:txBody/a:lstStyle", namespaces=_NS)
+_BODY_PR = etree.XPath("./p:txBody/a:bodyPr", namespaces=_NS)
+
+
+@dataclass(frozen=True)
+class BodyMetrics:
+    """Text area and per-level text styles of a layout's body placeholder, in points"""
+    font: str
+    width: float
+    height: float
+    sizes: Tuple[float, ...]
+    margins: Tuple[float, ...]
+    space_before_pct: Tuple[float, ...]
+    space_before_pts: Tuple[float, ...]
+    line_spacing: Tuple[float, ...]
+
+
+def _char_width(widths, char: str) -> int:
+    width = widths.get(char)
+    if width is not None:
+        return width
+    return WIDE_WIDTH if ord(char) >= 0x2E80 else OTHER_WIDTH
+
+
+@lru_cache(maxsize=65536)
+def _word_width(font: str, word: str) -> int:
+    """Width of a word in 1/1000 em; words repeat a lot across slides, so they are cached"""
+    widths = GLYPH_WIDTHS[font]
+    return sum(_char_width(widths, char) for char in word)
+
+
+def _wrapped_lines(font: str, text: str, size: float, width: float) -> int:
+    """Greedy word wrap, as PowerPoint does, returning the number of lines"""
+    if width <= 0:
+        return 1
+    scale = size / 1000
+    space = _word_width(font, " ") * scale
+    lines = 0
+    for segment in _LINE_BREAK.split(text):
+        lines += 1
+        line_width = 0.0
+        for word in segment.split(" "):
+            word_width = _word_width(font, word) * scale
+            if line_width and line_width + space + word_width <= width:
+                line_width += space + word_width
+                continue
+            if line_width:
+                lines += 1
+            # A word longer than the line is broken across as many lines as it needs
+            extra = max(0, math.ceil(word_width / width) - 1)
+            lines += extra
+            line_width = word_width - extra * width
+    return lines
+
+
+def _paragraph(item) -> Tuple[str, int]:
+    if isinstance(item, str):
+        return item, 0
+    text = item.text if isinstance(item.text, str) else "".join(item.text)
+    return text, getattr(item, "level", 0)
+
+
+def text_height(metrics: BodyMetrics, paragraphs: Iterable, scale: float = 1.0) -> float:
+    """Estimated height in points of `paragraphs` (strings or objects with text and level)"""
+    height = 0.0
+    for i, item in enumerate(paragraphs):
+        text, level = _paragraph(item)
+        level = min(level, LEVELS - 1)
+        size = metrics.sizes[level] * scale
+        lines = _wrapped_lines(metrics.font, text, size, metrics.width - metrics.margins[level])
+        height += lines * size * LINE_HEIGHT * metrics.line_spacing[level]
+        # PowerPoint ignores space before the first paragraph of a frame
+        if i:
+            height += metrics.space_before_pct[level] * size + metrics.space_before_pts[level]
+    return height
+
+
+def fits(metrics: BodyMetrics, paragraphs: Iterable, scale: float = 1.0) -> bool:
+    return text_height(metrics, paragraphs, scale) <= metrics.height
+
+
+def paginate(metrics: BodyMetrics, paragraphs: Sequence) -> List[List]:
+    """Split paragraphs into consecutive pages that each fit; a paragraph too tall on its own gets a page"""
+    pages: List[List] = [[]]
+    for item in paragraphs:
+        if pages[-1] and not fits(metrics, pages[-1] + [item]):
+            pages.append([])
+        pages[-1].append(item)
+    return pages
+
+
+def shrink_scale(metrics: BodyMetrics, paragraphs: Sequence, minimum: int = MIN_FONT_SCALE) -> int:
+    """Largest font scale in percent (minimum..100) at which the paragraphs fit, by binary search"""
+    low, high = minimum, 100
+    if fits(metrics, paragraphs, high / 100):
+        return high
+    while low < high:
+        middle = (low + high + 1) // 2
+        if fits(metrics, paragraphs, middle / 100):
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+def apply_font_scale(text_frame, percent: float) -> None:
+    """Store a shrink-on-overflow font scale, as PowerPoint does for autofit bodies"""
+    text_frame.auto_size = MSO_AUTO_SIZE.TEXT_TO_FIT_SHAPE
+    text_frame._bodyPr.normAutofit.fontScale = percent
+
+
+def _body_placeholder(shapes):
+    for shape in shapes:
+        if shape.is_placeholder and shape.placeholder_format.idx == 1:
+            return shape
+    return None
+
+
+def _apply_list_style(element, sizes, margins, spc_pct, spc_pts, spacing) -> None:
+    """Overlay the lvlNpPr settings found under `element` (a txStyles style or an a:lstStyle)"""
+    if element is None:
+        return
+    for level in range(LEVELS):
+        for pPr in _LEVEL_PPR[level](element):
+            if pPr.get("marL") is not None:
+                margins[level] = int(pPr.get("marL")) / EMU_PER_POINT
+            for sz in _FONT_SIZE(pPr):
+                sizes[level] = int(sz) / 100
+            for pct in _SPACE_BEFORE_PCT(pPr):
+                spc_pct[level], spc_pts[level] = int(pct) / 100000, 0.0
+            for pts in _SPACE_BEFORE_PTS(pPr):
+                spc_pct[level], spc_pts[level] = 0.0, int(pts) / 100
+            for pct in _LINE_SPACING(pPr):
+                spacing[level] = int(pct) / 100000
+
+
+def _theme_font(master) -> str:
+    try:
+        theme = master.part.part_related_by(RT.THEME).blob.decode("utf-8")
+    except (KeyError, ValueError):
+        return FALLBACK_FONT
+    match = re.search(r'<a:minorFont>\s*<a:latin typeface="([^"]+)"', theme)
+    return match.group(1) if match else FALLBACK_FONT
+
+
+def body_metrics(layout) -> Optional[BodyMetrics]:
+    """Metrics of the layout's body placeholder (idx 1), or None when the layout has none"""
+    placeholder = _body_placeholder(layout.placeholders)
+    if placeholder is None or placeholder.width is None or placeholder.height is None:
+        return None
+    master = layout.slide_master
+    master_body = next((shape for shape in master.placeholders
+                        if shape.placeholder_format.type == PP_PLACEHOLDER.BODY), None)
+
+    sizes = [18.0] * LEVELS
+    margins = [0.0] * LEVELS
+    spc_pct = [0.0] * LEVELS
+    spc_pts = [0.0] * LEVELS
+    spacing = [1.0] * LEVELS
+    styles = [next(iter(_BODY_STYLE(master._element)), None)]
+    insets = {"lIns": 91440, "rIns": 91440, "tIns": 45720, "bIns": 45720}
+    # Master body style, then the master's and the layout's placeholder overrides
+    for shape in (master_body, placeholder):
+        if shape is None:
+            continue
+        styles.extend(_LIST_STYLE(shape._element))
+        for bodyPr in _BODY_PR(shape._element):
+            insets.update({name: int(bodyPr.get(name)) for name in insets if bodyPr.get(name) is not None})
+    for style in styles:
+        _apply_list_style(style, sizes, margins, spc_pct, spc_pts, spacing)
+
+    font = _theme_font(master)
+    return BodyMetrics(
+        font=font if font in GLYPH_WIDTHS else FALLBACK_FONT,
+        width=(placeholder.width - insets["lIns"] - insets["rIns"]) / EMU_PER_POINT,
+        height=(placeholder.height - insets["tIns"] - insets["bIns"]) / EMU_PER_POINT,
+        sizes=tuple(sizes),
+        margins=tuple(margins),
+        space_before_pct=tuple(spc_pct),
+        space_before_pts=tuple(spc_pts),
+        line_spacing=tuple(spacing)
+    )
+
+
+def shrink_text_frame(shape, paragraphs: Sequence, metrics: Optional[BodyMetrics] = None,
+                      minimum: int = MIN_FONT_SCALE) -> Optional[int]:
+    """Give a filled body placeholder a font scale if its text overflows; returns the scale applied
+
+    Pass `metrics` when filling many slides on one layout, to read the template's styles only once.
+    """
+    if metrics is None:
+        metrics = body_metrics(shape.part.slide.slide_layout)
+    if metrics is None or fits(metrics, paragraphs):
+        return None
+    scale = shrink_scale(metrics, paragraphs, minimum)
+    apply_font_scale(shape.text_frame, scale)
+    return scale
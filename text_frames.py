@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Bulk text-frame builder for the PG Seminar Presentation Generator
+Assigning `tf.text += line` re-reads and rebuilds every paragraph on each
+call, which is quadratic in the number of lines. fill_text_frame() and
+append_paragraphs() add all paragraphs, levels and runs in a single pass.
+"""
+
+from typing import Iterable, NamedTuple, Sequence, Union
+
+
+class Paragraph(NamedTuple):
+    # A string, or one string per run; "\n" or "\v" inside a string is a line break, not a new paragraph
+    text: Union[str, Sequence[str]]
+    level: int = 0
+
+
+def _add_text(paragraph, text: Union[str, Sequence[str]]) -> None:
+    if isinstance(text, str):
+        paragraph.text = text
+    else:
+        for run_text in text:
+            paragraph.add_run().text = run_text
+
+
+def append_paragraphs(text_frame, paragraphs: Iterable) -> None:
+    """Append paragraphs after the frame's existing ones
+
+    Each item is a string, a Paragraph, or any object with `text` and `level`
+    attributes (such as deck_engine.Bullet).
+    """
+    for item in paragraphs:
+        paragraph = text_frame.add_paragraph()
+        if isinstance(item, str):
+            paragraph.text = item
+            continue
+        _add_text(paragraph, item.text)
+        level = getattr(item, "level", 0)
+        if level:
+            paragraph.level = level
+
+
+def fill_text_frame(text_frame, paragraphs: Iterable) -> None:
+    """Replace the frame's text with `paragraphs`, like `tf.text = "\\n".join(...)` but with levels and runs"""
+    items = iter(paragraphs)
+    text_frame.clear()
+    first = next(items, None)
+    if first is None:
+        return
+    # clear() leaves one empty paragraph, which takes the first item
+    paragraph = text_frame.paragraphs[0]
+    if isinstance(first, str):
+        paragraph.text = first
+    else:
+        _add_text(paragraph, first.text)
+        if getattr(first, "level", 0):
+            paragraph.level = first.level
+    append_paragraphs(text_frame, items)